@@ -5,9 +5,11 @@ Endpoints for managing notification preferences and checking lineup issues.
 Uses Clerk authentication (same as teams, matchups, etc.).
 """
 
+import asyncio
 import json
 from datetime import date
 
+import orjson
 from fastapi import APIRouter, Depends, Query
 
 from core.clerk_auth import get_current_user
@@ -288,7 +290,7 @@ async def check_lineup(
             data=None,
         )
 
-    league_info = json.loads(team.league_info)
+    league_info = orjson.loads(team.league_info)
     provider = league_info.get("provider", "espn")
 
     if provider != "espn":
@@ -305,7 +307,8 @@ async def check_lineup(
     earliest_game_time = Game.get_earliest_game_time_on_date(today)
 
     # Fetch roster
-    roster = espn_extractor.get_roster_with_slots(
+    roster = await asyncio.to_thread(
+        espn_extractor.get_roster_with_slots,
         league_id=league_info["league_id"],
         team_name=league_info.get("team_name", ""),
         espn_s2=league_info.get("espn_s2", ""),
@@ -383,7 +386,7 @@ async def send_test_alert(
     if not team:
         return {"status": "not_found", "message": "Team not found"}
 
-    league_info = json.loads(team.league_info)
+    league_info = orjson.loads(team.league_info)
     provider = league_info.get("provider", "espn")
 
     if provider != "espn":
@@ -396,7 +399,8 @@ async def send_test_alert(
     earliest_game_time = Game.get_earliest_game_time_on_date(today)
 
     # Fetch roster from ESPN
-    roster = espn_extractor.get_roster_with_slots(
+    roster = await asyncio.to_thread(
+        espn_extractor.get_roster_with_slots,
         league_id=league_info["league_id"],
         team_name=league_info.get("team_name", ""),
         espn_s2=league_info.get("espn_s2", ""),
@@ -5,6 +5,7 @@ Read-only endpoints for current in-game stats and scoreboard data.
 No authentication required.
 """
 
+import asyncio
 from datetime import datetime, timedelta, date
 
 import pytz
@@ -164,7 +165,7 @@ async def get_live_scoreboard(request: Request) -> dict:
 
     extractor = NBAApiExtractor()
     try:
-        games = extractor.get_scoreboard_games(game_date)
+        games = await asyncio.to_thread(extractor.get_scoreboard_games, game_date)
     except Exception as e:
         log.error("live_scoreboard_error", error=str(e))
         return {
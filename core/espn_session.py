@@ -0,0 +1,34 @@
+"""
+ESPN HTTP Session
+
+Keep-alive requests.Session setup shared by EspnService and ESPNExtractor,
+so repeated ESPN calls reuse TCP/TLS connections instead of paying a fresh
+handshake per call.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+ESPN_POOL_SIZE = 16
+
+
+def create_espn_session() -> requests.Session:
+    """
+    Create a pooled session for ESPN Fantasy API calls.
+
+    League cookies (espn_s2, SWID) are passed per request and the session
+    never stores response cookies, so one user's cookies can't be sent with
+    another user's request. No urllib3 Retry is mounted: callers that retry
+    do so explicitly (@with_retry), and blind retries would multiply latency
+    and load on ESPN.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=ESPN_POOL_SIZE, pool_maxsize=ESPN_POOL_SIZE),
+    )
+    return session
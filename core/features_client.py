@@ -0,0 +1,43 @@
+"""
+Features Service Client
+
+Process-wide httpx.AsyncClient for calls to the features (lineup
+generation) service, so keep-alive connections are reused across requests
+instead of paying a fresh TCP/TLS handshake per call.
+"""
+
+import httpx
+
+from utils.constants import FEATURES_SERVER_ENDPOINT
+
+
+# Lineup generation can take a while to respond, but connecting and waiting
+# for a pooled connection should not: fail those fast so backpressure
+# surfaces instead of queueing behind a slow upstream.
+FEATURES_TIMEOUT = httpx.Timeout(connect=2.0, read=30.0, write=5.0, pool=1.0)
+
+GENERATE_LINEUP_PATH = "/generate-lineup"
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_features_client() -> httpx.AsyncClient:
+    """Return the shared features-service client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=FEATURES_SERVER_ENDPOINT,
+            timeout=FEATURES_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+            ),
+        )
+    return _client
+
+
+async def close_features_client() -> None:
+    """Close the shared features-service client (application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -5,7 +5,9 @@ Provides retry decorators, circuit breakers, and resilient HTTP client
 for handling transient failures in external API calls.
 """
 
+import functools
 import logging
+import threading
 from typing import Any, Callable, Optional, TypeVar
 
 import requests
@@ -67,6 +69,12 @@ class ClientError(Exception):
         self.status_code = status_code
 
 
+class BulkheadFullError(Exception):
+    """Raised when no bulkhead slot frees up in time. Not retryable."""
+
+    pass
+
+
 # -----------------------------------------------------------------------------
 # Retry Decorators
 # -----------------------------------------------------------------------------
@@ -191,6 +199,56 @@ espn_api_circuit = create_circuit_breaker(
 )
 
 
+# -----------------------------------------------------------------------------
+# Bulkheads
+# -----------------------------------------------------------------------------
+
+
+def create_bulkhead(name: str, max_concurrent: int, max_wait: float = 5.0) -> Callable:
+    """
+    Create a bulkhead decorator capping concurrent calls to one upstream.
+
+    A burst of requests (or pipelines running side by side) can otherwise
+    put every worker thread on the same API at once and trip its rate
+    limits. Extra callers wait up to max_wait seconds for a free slot, then
+    fail fast with BulkheadFullError. The wait blocks the calling thread,
+    so guarded functions must be called off the event loop
+    (asyncio.to_thread). Apply it inside @with_retry so a slot is only held
+    while a request is in flight, not during backoff.
+
+    Args:
+        name: Upstream name for logging
+        max_concurrent: Maximum in-flight calls
+        max_wait: Seconds to wait for a slot before giving up
+
+    Returns:
+        A bulkhead decorator
+    """
+    slots = threading.BoundedSemaphore(max_concurrent)
+    log = get_logger("bulkhead")
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            if not slots.acquire(timeout=max_wait):
+                log.warning("bulkhead_full", bulkhead=name, function=func.__name__)
+                raise BulkheadFullError(f"{name} bulkhead full ({max_concurrent} in flight)")
+            try:
+                return func(*args, **kwargs)
+            finally:
+                slots.release()
+
+        return wrapper
+
+    return decorator
+
+
+# Pre-configured bulkheads for external APIs
+nba_api_bulkhead = create_bulkhead(name="nba_api", max_concurrent=4)
+
+espn_api_bulkhead = create_bulkhead(name="espn_api", max_concurrent=6)
+
+
 # -----------------------------------------------------------------------------
 # Resilient HTTP Client
 # -----------------------------------------------------------------------------
@@ -400,6 +458,7 @@ __all__ = [
     "NetworkError",
     "ServerError",
     "ClientError",
+    "BulkheadFullError",
     "CircuitBreakerError",
     "RetryError",
     "create_retry_decorator",
@@ -407,6 +466,9 @@ __all__ = [
     "create_circuit_breaker",
     "nba_api_circuit",
     "espn_api_circuit",
+    "create_bulkhead",
+    "nba_api_bulkhead",
+    "espn_api_bulkhead",
     "resilient_request",
     "ResilientHTTPClient",
     "is_circuit_open",
@@ -190,6 +190,57 @@ class PlayerGameStats(BaseModel):
             .limit(limit)
         )
 
+    @classmethod
+    def get_player_game_logs(
+        cls,
+        player_id: int,
+        limit: int | None = None,
+        team_id: str | None = None,
+        newest_first: bool = True,
+    ) -> list[tuple]:
+        """
+        Get a player's game log rows as lightweight namedtuples.
+
+        Selects only the columns a game log needs and skips model
+        instantiation, for read paths that serialize the rows directly.
+
+        Args:
+            player_id: NBA player ID
+            limit: Maximum number of games to return (None for all)
+            team_id: Only games played for this team
+            newest_first: Order by date descending (True) or ascending
+
+        Returns:
+            Namedtuples with game_date, team and box score stats
+        """
+        query = (
+            cls.select(
+                cls.game_date,
+                cls.team,
+                cls.fpts,
+                cls.pts,
+                cls.reb,
+                cls.ast,
+                cls.stl,
+                cls.blk,
+                cls.tov,
+                cls.min,
+                cls.fgm,
+                cls.fga,
+                cls.fg3m,
+                cls.fg3a,
+                cls.ftm,
+                cls.fta,
+            )
+            .where(cls.player_id == player_id)
+            .order_by(cls.game_date.desc() if newest_first else cls.game_date.asc())
+        )
+        if team_id is not None:
+            query = query.where(cls.team == team_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return list(query.namedtuples())
+
     @classmethod
     def get_games_by_date(cls, game_date) -> list["PlayerGameStats"]:
         """
@@ -166,25 +166,19 @@ class PlayerInjury(BaseModel):
         """
         check_date = report_date or date.today()
 
-        # Get the most recent report for each player on or before the check date
-        from peewee import fn
-
-        subquery = (
-            cls.select(cls.player_id, fn.MAX(cls.report_date).alias("max_date"))
+        # Most recent report for each player on or before the check date.
+        # DISTINCT ON walks the unique (player, report_date) index once,
+        # instead of a GROUP BY aggregate joined back to the table.
+        latest_ids = (
+            cls.select(cls.id)
             .where(cls.report_date <= check_date)
-            .group_by(cls.player_id)
+            .distinct(cls.player)
+            .order_by(cls.player, cls.report_date.desc())
         )
 
         return list(
             cls.select()
-            .join(
-                subquery,
-                on=(
-                    (cls.player_id == subquery.c.player_id)
-                    & (cls.report_date == subquery.c.max_date)
-                ),
-            )
-            .where(cls.status != "Available")
+            .where((cls.id.in_(latest_ids)) & (cls.status != "Available"))
             .order_by(cls.status, cls.player_id)
         )
 
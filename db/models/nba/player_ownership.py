@@ -57,7 +57,9 @@ class PlayerOwnership(BaseModel):
         indexes = (
             # Unique constraint: one row per player per date
             (("player", "snapshot_date"), True),
-            # Index for trending queries
+            # Index for trending queries. Trending snapshot reads are served by
+            # the covering (snapshot_date, player_id) INCLUDE (rost_pct) index
+            # from migrations/003, which peewee can't declare here.
             (("snapshot_date", "rost_pct"), False),
         )
 
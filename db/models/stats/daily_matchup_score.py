@@ -51,8 +51,31 @@ class DailyMatchupScore(BaseModel):
         schema = "stats_s2"
         primary_key = False
         indexes = (
-            (("team_id", "matchup_period", "date"), True),  # Composite unique
+            # Composite unique. Also serves the live matchup's latest-baseline
+            # lookup (team + period, ORDER BY date DESC LIMIT 1) as a backward
+            # index scan, so no separate descending index is needed.
+            (("team_id", "matchup_period", "date"), True),
         )
 
+    @classmethod
+    def get_latest_baseline(
+        cls, team_id: int, matchup_period: int | None = None
+    ) -> "DailyMatchupScore | None":
+        """
+        Get the most recent score snapshot for a team.
+
+        Args:
+            team_id: Team ID
+            matchup_period: Restrict to this matchup period (week) number.
+                If None, returns the latest snapshot across all periods.
+
+        Returns:
+            Latest DailyMatchupScore by date, or None if none captured yet
+        """
+        query = cls.select().where(cls.team_id == team_id)
+        if matchup_period is not None:
+            query = query.where(cls.matchup_period == matchup_period)
+        return query.order_by(cls.date.desc()).first()
+
     def __repr__(self):
         return f"<DailyMatchupScore(team_id={self.team_id}, matchup={self.matchup_period}, date={self.date}, score={self.current_score})>"
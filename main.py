@@ -9,6 +9,7 @@ import utils.patches  # noqa: F401 - imported for side effect (patches nba_api)
 from core.middleware import setup_middleware
 from core.db_middleware import DatabaseMiddleware
 from core.correlation_middleware import CorrelationMiddleware
+from core.features_client import close_features_client
 from core.logging import setup_logging, get_logger
 from core.settings import settings
 from core.rate_limit import limiter, rate_limit_exceeded_handler
@@ -33,6 +34,9 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Close shared outbound HTTP clients
+    await close_features_client()
+
     # Close database connection
     close_db()
     log.info("application_stopped")
@@ -0,0 +1,12 @@
+-- Migration: Covering index for ownership trending snapshot reads
+-- Run this against your PostgreSQL database
+
+-- get_trending reads (player_id, rost_pct) for two snapshot dates. With
+-- rost_pct included the reads are index-only scans instead of heap fetches.
+-- CONCURRENTLY avoids locking writes from the ownership pipeline; it cannot
+-- run inside a transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_player_ownership_date_player_rost
+ON nba.player_ownership (snapshot_date, player_id) INCLUDE (rost_pct);
+
+-- The latest-game team fallback needs no new index: the unique
+-- (player_id, game_date) index on nba.player_game_stats already serves it.
@@ -4,16 +4,18 @@ ESPN Extractor
 Fetches data from ESPN Fantasy Basketball API.
 """
 
-import json
 from typing import Optional, Any
 
+import orjson
 import requests
 
+from core.espn_session import create_espn_session
 from core.logging import get_logger
 from core.settings import settings
 from core.resilience import (
     with_retry,
     espn_api_circuit,
+    espn_api_bulkhead,
     NetworkError,
     RateLimitError,
     ServerError,
@@ -39,6 +41,7 @@ class ESPNExtractor(BaseExtractor):
 
     def __init__(self):
         super().__init__("espn")
+        self._session = create_espn_session()
 
     def extract(self, **kwargs: Any) -> Any:
         """Not used directly - use specific methods below."""
@@ -50,6 +53,7 @@ class ESPNExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @espn_api_circuit
+    @espn_api_bulkhead
     def get_player_data(
         self,
         year: Optional[int] = None,
@@ -82,12 +86,12 @@ class ESPNExtractor(BaseExtractor):
                 },
             }
         }
-        headers = {"x-fantasy-filter": json.dumps(filters)}
+        headers = {"x-fantasy-filter": orjson.dumps(filters).decode()}
 
         self.log.debug("request_start", endpoint=endpoint)
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 endpoint,
                 params=params,
                 headers=headers,
@@ -102,7 +106,7 @@ class ESPNExtractor(BaseExtractor):
                 raise ServerError("ESPN server error", status_code=response.status_code)
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
         except requests.exceptions.Timeout:
             raise NetworkError("ESPN request timed out")
@@ -124,6 +128,18 @@ class ESPNExtractor(BaseExtractor):
         self.log.info("request_complete", player_count=len(cleaned_data))
         return cleaned_data
 
+    @espn_api_bulkhead
+    def _get_matchup_view(self, endpoint: str, params: dict, cookies: dict) -> dict:
+        """Fetch and parse the league matchup view, holding an ESPN bulkhead slot."""
+        response = self._session.get(
+            endpoint,
+            params=params,
+            cookies=cookies,
+            timeout=settings.http_timeout,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def get_matchup_data(
         self,
         league_id: int,
@@ -153,14 +169,9 @@ class ESPNExtractor(BaseExtractor):
         endpoint = ESPN_FANTASY_ENDPOINT.format(year, league_id)
 
         try:
-            response = requests.get(
-                endpoint,
-                params=params,
-                cookies=cookies,
-                timeout=settings.http_timeout,
-            )
-            response.raise_for_status()
-            data = response.json()
+            # A full bulkhead (BulkheadFullError) is handled like any other
+            # fetch failure, so callers still just get None
+            data = self._get_matchup_view(endpoint, params, cookies)
         except Exception as e:
             self.log.warning("matchup_error", error=str(e), team=team_name)
             return None
@@ -222,6 +233,7 @@ class ESPNExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @espn_api_circuit
+    @espn_api_bulkhead
     def get_roster_with_slots(
         self,
         league_id: int,
@@ -254,7 +266,7 @@ class ESPNExtractor(BaseExtractor):
         team_abbrev_corrections = {"PHL": "PHI", "PHO": "PHX"}
 
         try:
-            response = requests.get(
+            response = self._session.get(
                 endpoint,
                 params=params,
                 cookies=cookies,
@@ -269,7 +281,7 @@ class ESPNExtractor(BaseExtractor):
                 raise ServerError("ESPN server error", status_code=response.status_code)
 
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
         except requests.exceptions.Timeout:
             raise NetworkError("ESPN request timed out")
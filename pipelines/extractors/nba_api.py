@@ -9,11 +9,23 @@ from datetime import date
 from typing import Any
 
 import pandas as pd
+from nba_api.live.nba.endpoints import boxscore as live_boxscore
+from nba_api.live.nba.endpoints import scoreboard as live_scoreboard
+from nba_api.stats.endpoints import (
+    commonplayerinfo,
+    leaguedashplayerstats,
+    leaguedashteamstats,
+    leaguegamelog,
+    leagueleaders,
+    playergamelogs,
+    playerindex,
+)
 
 from core.settings import settings
 from core.resilience import (
     with_retry,
     nba_api_circuit,
+    nba_api_bulkhead,
     NetworkError,
 )
 from pipelines.extractors.base import BaseExtractor
@@ -44,6 +56,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_game_logs(self, date_str: str, season: str) -> pd.DataFrame:
         """
         Fetch player game logs from NBA API for a specific date.
@@ -55,8 +68,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             DataFrame with player game stats
         """
-        from nba_api.stats.endpoints import playergamelogs
-
         self.log.debug("game_logs_start", date=date_str, season=season)
 
         try:
@@ -84,6 +95,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_league_leaders(self, season: str | None = None) -> list[dict]:
         """
         Fetch league leaders from NBA API.
@@ -94,8 +106,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of player dicts with stats
         """
-        from nba_api.stats.endpoints import leagueleaders
-
         season = season or settings.nba_season
         self.log.debug("leaders_start", season=season)
 
@@ -124,6 +134,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_advanced_stats(self, season: str | None = None) -> list[dict]:
         """
         Fetch advanced player stats from NBA API.
@@ -137,8 +148,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of player dicts with advanced stats
         """
-        from nba_api.stats.endpoints import leaguedashplayerstats
-
         season = season or settings.nba_season
         self.log.debug("advanced_stats_start", season=season)
 
@@ -167,6 +176,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_player_info(self, player_id: int) -> dict | None:
         """
         Fetch detailed player info from NBA API.
@@ -179,8 +189,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             Dict with player info or None if not found
         """
-        from nba_api.stats.endpoints import commonplayerinfo
-
         self.log.debug("player_info_start", player_id=player_id)
 
         try:
@@ -212,6 +220,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_league_game_log(self, season: str | None = None) -> list[dict]:
         """
         Fetch league-wide game log from NBA API.
@@ -224,8 +233,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of game dicts with scores and details
         """
-        from nba_api.stats.endpoints import leaguegamelog
-
         season = season or settings.nba_season
         self.log.debug("league_game_log_start", season=season)
 
@@ -253,6 +260,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_player_index(self, season: str | None = None) -> list[dict]:
         """
         Fetch all player profiles in a single bulk API call.
@@ -266,8 +274,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of player dicts with profile data
         """
-        from nba_api.stats.endpoints import playerindex
-
         season = season or settings.nba_season
         self.log.debug("player_index_start", season=season)
 
@@ -295,6 +301,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def check_all_games_final(self, game_date: date) -> bool:
         """
         Check if all NBA games on a given date have finished.
@@ -310,8 +317,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             True if all games are final, False if any are still live
         """
-        from nba_api.live.nba.endpoints import scoreboard as live_scoreboard
-
         date_str = game_date.isoformat()
         self.log.debug("scoreboard_check_start", game_date=date_str)
 
@@ -359,6 +364,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_scoreboard_games(self, game_date: date) -> list[dict]:
         """
         Fetch today's games from the live scoreboard.
@@ -373,8 +379,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of dicts with keys: game_id, game_status, period, game_clock
         """
-        from nba_api.live.nba.endpoints import scoreboard as live_scoreboard
-
         date_str = game_date.isoformat()
         self.log.debug("scoreboard_games_start", game_date=date_str)
 
@@ -424,6 +428,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_live_box_score(self, game_id: str) -> dict | None:
         """
         Fetch the live box score for a specific game.
@@ -438,8 +443,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             Game dict with homeTeam/awayTeam player arrays, or None if not found
         """
-        from nba_api.live.nba.endpoints import boxscore as live_boxscore
-
         self.log.debug("live_box_score_start", game_id=game_id)
 
         try:
@@ -475,6 +478,7 @@ class NBAApiExtractor(BaseExtractor):
         max_delay=settings.retry_max_delay,
     )
     @nba_api_circuit
+    @nba_api_bulkhead
     def get_team_stats(self, season: str | None = None) -> list[dict]:
         """
         Fetch team stats from NBA API combining advanced and base measures.
@@ -490,8 +494,6 @@ class NBAApiExtractor(BaseExtractor):
         Returns:
             List of 30 team dicts with both advanced and base stats merged
         """
-        from nba_api.stats.endpoints import leaguedashteamstats
-
         season = season or settings.nba_season
         self.log.debug("team_stats_start", season=season)
 
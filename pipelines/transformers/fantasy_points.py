@@ -4,8 +4,12 @@ Fantasy Points Transformer
 Calculates fantasy points using the league scoring formula.
 """
 
+import re
 from typing import TypedDict, Union
 
+# nba_api live BoxScore minutes, e.g. "PT34M56.00S"
+_ISO_MINUTES_RE = re.compile(r"PT(\d+)M")
+
 
 class PlayerStats(TypedDict):
     """Type definition for player stats used in fantasy point calculation."""
@@ -92,8 +96,6 @@ def minutes_to_int(min_str: Union[str, int, float, None]) -> int:
         >>> minutes_to_int(None)
         0
     """
-    import re
-
     if min_str is None:
         return 0
 
@@ -104,7 +106,7 @@ def minutes_to_int(min_str: Union[str, int, float, None]) -> int:
 
     # ISO 8601 duration format: "PT18M00.00S" (from nba_api live BoxScore)
     if s.startswith("PT"):
-        match = re.match(r"PT(\d+)M", s)
+        match = _ISO_MINUTES_RE.match(s)
         if match:
             return int(match.group(1))
         return 0
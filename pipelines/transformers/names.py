@@ -5,8 +5,12 @@ Utilities for normalizing player names for matching across data sources.
 """
 
 import unicodedata
+from functools import lru_cache
 
 
+# The set of player names is small and bounded (actives plus history), so
+# each name only pays for NFD decomposition once per process.
+@lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     """
     Normalize a name by removing diacritics and converting to lowercase.
@@ -22,6 +26,10 @@ def normalize_name(name: str) -> str:
         >>> normalize_name("Luka Dončić")
         'luka doncic'
     """
+    # Most names are plain ASCII, which NFD leaves unchanged
+    if name.isascii():
+        return name.lower().strip()
+
     # Decompose unicode characters (e.g., é → e + combining accent)
     normalized = unicodedata.normalize("NFD", name)
 
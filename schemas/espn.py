@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional
 from .common import BaseRequest, BaseResponse, LeagueInfo
 
@@ -16,6 +16,9 @@ class PlayerResp(BaseModel):
     injured: bool
     injury_status: Optional[str] = None
 
+# Dumps/validates whole player lists in one call to the compiled core
+PLAYER_LIST_ADAPTER = TypeAdapter(list[PlayerResp])
+
 class TeamDataReq(BaseRequest):
     league_info: LeagueInfo
     fa_count: int
@@ -1,12 +1,16 @@
 from datetime import datetime
+import orjson
 import requests
-import json
 from schemas.espn import ValidateLeagueResp, PlayerResp, LeagueInfo, TeamDataResp
 from schemas.matchup import MatchupResp, MatchupData, MatchupTeamResp, MatchupPlayerResp
 from utils.constants import ESPN_FANTASY_ENDPOINT
 from utils.espn_helpers import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP, STAT_ID_MAP, AVG_WINDOW_MAP, json_parsing
 from schemas.common import ApiStatus
 from services.schedule_service import get_remaining_games, get_dates_for_scoring_periods
+from core.espn_session import create_espn_session
+
+# Shared keep-alive session for ESPN calls
+_ESPN_SESSION = create_espn_session()
 
 class Player(object):
     '''Player are part of team'''
@@ -83,9 +87,9 @@ class EspnService:
         endpoint = ESPN_FANTASY_ENDPOINT.format(league_info.year, league_info.league_id)
 
         try:
-            response = requests.get(endpoint, params=params, cookies={'espn_s2': league_info.espn_s2, 'SWID': league_info.swid})
+            response = _ESPN_SESSION.get(endpoint, params=params, cookies={'espn_s2': league_info.espn_s2, 'SWID': league_info.swid})
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             teams = [team['name'] for team in data['teams']]
             return ValidateLeagueResp(status=ApiStatus.SUCCESS, valid=True, message="Team found") if league_info.team_name in teams else ValidateLeagueResp(status=ApiStatus.SUCCESS, valid=False, message="Team not found in valid league")
         except requests.exceptions.HTTPError as e:
@@ -110,7 +114,7 @@ class EspnService:
             }
             
             endpoint = ESPN_FANTASY_ENDPOINT.format(league_info.year, league_info.league_id)
-            data = requests.get(endpoint, params=params, cookies=cookies).json()
+            data = orjson.loads(_ESPN_SESSION.get(endpoint, params=params, cookies=cookies).content)
             roster = EspnService.get_roster(league_info.team_name, data['teams'])
             players = [Player(player, league_info.year) for player in roster]
 
@@ -145,7 +149,7 @@ class EspnService:
             }
 
             filters = {"players":{"filterStatus":{"value":["FREEAGENT","WAIVERS"]},"filterSlotIds":{"value":[]},"limit":fa_count,"sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":100,"sortAsc":True,"value":"STANDARD"}}}
-            headers = {'x-fantasy-filter': json.dumps(filters)}
+            headers = {'x-fantasy-filter': orjson.dumps(filters).decode()}
 
             cookies = {
                 'espn_s2': league_info.espn_s2,
@@ -153,7 +157,7 @@ class EspnService:
             }
 
             endpoint = ESPN_FANTASY_ENDPOINT.format(league_info.year, league_info.league_id)
-            data = requests.get(endpoint, params=params, headers=headers, cookies=cookies).json()
+            data = orjson.loads(_ESPN_SESSION.get(endpoint, params=params, headers=headers, cookies=cookies).content)
             players = [Player(player, league_info.year) for player in data['players']]
 
             team_abbrev_corrections = {"PHL": "PHI", "PHO": "PHX"}
@@ -185,9 +189,9 @@ class EspnService:
         }
         endpoint = ESPN_FANTASY_ENDPOINT.format(year, league_id)
         filters = {"players":{"filterSlotIds":{"value":[]},"limit": 750, "sortPercOwned":{"sortPriority":1,"sortAsc":False},"sortDraftRanks":{"sortPriority":2,"sortAsc":True,"value":"STANDARD"}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
+        headers = {'x-fantasy-filter': orjson.dumps(filters).decode()}
 
-        data = requests.get(endpoint, params=params, headers=headers).json()
+        data = orjson.loads(_ESPN_SESSION.get(endpoint, params=params, headers=headers).content)
         data = data['players']
         data = [x.get('player', x) for x in data]
 
@@ -236,9 +240,9 @@ class EspnService:
             }
 
             endpoint = ESPN_FANTASY_ENDPOINT.format(league_info.year, league_info.league_id)
-            response = requests.get(endpoint, params=params, cookies=cookies)
+            response = _ESPN_SESSION.get(endpoint, params=params, cookies=cookies)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Get current matchup period from ESPN
             status = data.get('status', {})
@@ -2,6 +2,7 @@
 Service for game-related operations.
 """
 
+import asyncio
 from datetime import date, datetime, timedelta
 
 import pytz
@@ -73,7 +74,7 @@ class GamesService:
                     from pipelines.extractors.nba_api import NBAApiExtractor
                     try:
                         extractor = NBAApiExtractor()
-                        live_games = extractor.get_scoreboard_games(game_date)
+                        live_games = await asyncio.to_thread(extractor.get_scoreboard_games, game_date)
                         live_by_id = {g["game_id"]: g for g in live_games}
 
                         game_list = [
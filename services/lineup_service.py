@@ -1,18 +1,30 @@
 import asyncio
 import hashlib
-import httpx
 import json
+import orjson
 
 from schemas.lineup import LineupInfo, SlimGene, SlimPlayer
-from schemas.espn import PlayerResp
+from schemas.espn import PLAYER_LIST_ADAPTER, PlayerResp
 from schemas.lineup import GetLineupsResp, SaveLineupResp, DeleteLineupResp, GenerateLineupResp
 from schemas.common import ApiStatus, FantasyProvider
+from core.features_client import GENERATE_LINEUP_PATH, get_features_client
 from services.espn_service import EspnService
 from services.yahoo_service import YahooService
 from services.player_service import PlayerService
 from services.team_service import TeamService
 from db.models import Lineup, Team
-from utils.constants import FEATURES_SERVER_ENDPOINT, NUM_FREE_AGENTS
+from utils.constants import NUM_FREE_AGENTS
+
+
+def _slim_player(player: dict) -> SlimPlayer:
+    """Build a SlimPlayer from a stored lineup entry without re-validating it.
+
+    Stored lineups were validated when they were saved, so the fixed fields
+    are passed straight through instead of going through **kwargs validation.
+    """
+    return SlimPlayer.model_construct(
+        Name=player['Name'], AvgPoints=player['AvgPoints'], Team=player['Team']
+    )
 
 
 class LineupService:
@@ -27,7 +39,7 @@ class LineupService:
         Raises ValueError if the provider fetch fails.
         """
         team = Team.select().where(Team.user_id == user_id).where(Team.team_id == team_id).get()
-        league_info = TeamService.deserialize_league_info(json.loads(team.league_info))
+        league_info = TeamService.deserialize_league_info(orjson.loads(team.league_info))
 
         if league_info.provider == FantasyProvider.YAHOO:
             team_resp = await YahooService.get_team_data(league_info, 0, team_id)
@@ -71,18 +83,19 @@ class LineupService:
     @staticmethod
     async def generate_lineup_v2(roster_data: list[PlayerResp], free_agent_data: list[PlayerResp], streaming_slots: int, week: int) -> GenerateLineupResp:
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{FEATURES_SERVER_ENDPOINT}/generate-lineup",
-                    json={
-                        "roster_data": [p.model_dump() for p in roster_data],
-                        "free_agent_data": [p.model_dump() for p in free_agent_data],
-                        "streaming_slots": streaming_slots,
-                        "week": week,
-                    },
-                )
-                response.raise_for_status()
-            return GenerateLineupResp(status=ApiStatus.SUCCESS, message="Lineup generated successfully", data=response.json())
+            client = get_features_client()
+            response = await client.post(
+                GENERATE_LINEUP_PATH,
+                content=orjson.dumps({
+                    "roster_data": PLAYER_LIST_ADAPTER.dump_python(roster_data),
+                    "free_agent_data": PLAYER_LIST_ADAPTER.dump_python(free_agent_data),
+                    "streaming_slots": streaming_slots,
+                    "week": week,
+                }),
+                headers={"Content-Type": "application/json"},
+            )
+            response.raise_for_status()
+            return GenerateLineupResp(status=ApiStatus.SUCCESS, message="Lineup generated successfully", data=orjson.loads(response.content))
         except Exception as e:
             print(f"Error in generate_lineup_v2: {e}")
             return GenerateLineupResp(status=ApiStatus.ERROR, message="Internal server error", data=None)
@@ -135,9 +148,9 @@ class LineupService:
                 Lineup=[
                     SlimGene(
                         Day=gene['Day'],
-                        Additions=[SlimPlayer(**player) for player in gene['Additions']],
-                        Removals=[SlimPlayer(**player) for player in gene['Removals']],
-                        Roster={pos: SlimPlayer(**player) for pos, player in gene['Roster'].items()}
+                        Additions=[_slim_player(player) for player in gene['Additions']],
+                        Removals=[_slim_player(player) for player in gene['Removals']],
+                        Roster={pos: _slim_player(player) for pos, player in gene['Roster'].items()}
                     ) for gene in lineup_data['Lineup']
                 ]
             ))
@@ -1,4 +1,12 @@
+import asyncio
+import math
+import time
 from datetime import datetime, date as date_type, timedelta
+from operator import itemgetter
+
+import pytz
+from peewee import JOIN, fn
+from pydantic import TypeAdapter
 
 from services.espn_service import EspnService
 from services.yahoo_service import YahooService
@@ -26,6 +34,174 @@ from schemas.matchup import (
 )
 from schemas.common import ApiStatus, LeagueInfo, FantasyProvider
 from db.models.stats.daily_matchup_score import DailyMatchupScore
+from db.models.nba.games import Game
+from db.models.nba.live_player_stats import LivePlayerStats
+from db.models.nba.player_game_stats import PlayerGameStats
+from db.models.nba.players import Player
+
+
+_EASTERN = pytz.timezone("US/Eastern")
+
+# Lineup slots whose points don't count toward the matchup score
+_BENCH_SLOTS = frozenset({"BE", "IR"})
+
+# Validates a whole score history in one call to the compiled validator
+_HISTORY_ADAPTER = TypeAdapter(list[DailyScorePoint])
+
+# Short-lived cache of games by date. Many users open the same day's
+# drill-down within a minute of each other; the schedule rarely changes
+# faster than that.
+_GAMES_ON_DATE_TTL_SECONDS = 60
+_GAMES_ON_DATE_MAX_ENTRIES = 64
+_games_on_date_cache: dict[date_type, tuple[float, list[Game]]] = {}
+
+
+def _get_nba_today() -> date_type:
+    """Return today's NBA game date in ET (before 6am = yesterday)."""
+    now_et = datetime.now(_EASTERN)
+    if now_et.hour < 6:
+        return (now_et - timedelta(days=1)).date()
+    return now_et.date()
+
+
+def _get_games_on_date(target_date: date_type) -> list[Game]:
+    """Game.get_games_on_date with a short per-date TTL cache."""
+    now = time.monotonic()
+    cached = _games_on_date_cache.get(target_date)
+    if cached and now - cached[0] < _GAMES_ON_DATE_TTL_SECONDS:
+        return cached[1]
+
+    games = Game.get_games_on_date(target_date)
+    if len(_games_on_date_cache) >= _GAMES_ON_DATE_MAX_ENTRIES:
+        _games_on_date_cache.clear()
+    _games_on_date_cache[target_date] = (now, games)
+    return games
+
+
+def _resolve_players_with_day_stats(
+    espn_ids: list[int],
+    norm_names: list[str],
+    target_date: date_type,
+) -> tuple[dict[int, int], dict[str, int], dict[int, PlayerGameStats]]:
+    """
+    Resolve roster players to NBA IDs and pull their box scores for one date.
+
+    A single query: the LEFT JOIN keeps players without a game that day so
+    they still resolve to an NBA ID.
+
+    Returns:
+        (espn_id -> NBA ID, normalized name -> NBA ID, NBA ID -> box score
+        for players who played on target_date)
+    """
+    players = (
+        Player.select(Player, PlayerGameStats)
+        .join(
+            PlayerGameStats,
+            JOIN.LEFT_OUTER,
+            on=(
+                (PlayerGameStats.player == Player.id)
+                & (PlayerGameStats.game_date == target_date)
+            ),
+            attr="day_stats",
+        )
+        .where(Player.espn_id.in_(espn_ids) | Player.name_normalized.in_(norm_names))
+    )
+    espn_to_nba: dict[int, int] = {}
+    name_to_nba: dict[str, int] = {}
+    nba_id_to_stats: dict[int, PlayerGameStats] = {}
+    for player in players:
+        if player.espn_id is not None:
+            espn_to_nba[player.espn_id] = player.id
+        name_to_nba[player.name_normalized] = player.id
+        # Peewee leaves day_stats unset when the LEFT JOIN found no game
+        day_stats = getattr(player, "day_stats", None)
+        if day_stats is not None:
+            nba_id_to_stats[player.id] = day_stats
+    return espn_to_nba, name_to_nba, nba_id_to_stats
+
+
+def _build_past_roster(
+    roster, resolve_nba_id, teams_playing: set[str], nba_id_to_stats: dict
+) -> list[DailyMatchupPlayerStats]:
+    """Build a past/today day roster, sorted for display."""
+    # Sort: players with stats first (by fpts desc), then had_game but no stats, then no game.
+    # Keys are built once per player while the inputs are at hand.
+    keyed = []
+    for p in roster:
+        nba_id = resolve_nba_id(p)
+        had_game = p.team in teams_playing
+        stats = nba_id_to_stats.get(nba_id) if nba_id else None
+        fpts = stats.fpts if stats else None
+        sort_key = (0 if fpts is not None else (1 if had_game else 2), -(fpts or 0))
+        keyed.append((sort_key, DailyMatchupPlayerStats.model_construct(
+            player_id=p.player_id,
+            name=p.name,
+            team=p.team,
+            position=p.position,
+            nba_player_id=nba_id,
+            had_game=had_game,
+            fpts=fpts,
+            pts=stats.pts if stats else None,
+            reb=stats.reb if stats else None,
+            ast=stats.ast if stats else None,
+            stl=stats.stl if stats else None,
+            blk=stats.blk if stats else None,
+            tov=stats.tov if stats else None,
+            min=stats.min if stats else None,
+            fgm=stats.fgm if stats else None,
+            fga=stats.fga if stats else None,
+            fg3m=stats.fg3m if stats else None,
+            fg3a=stats.fg3a if stats else None,
+            ftm=stats.ftm if stats else None,
+            fta=stats.fta if stats else None,
+        )))
+    keyed.sort(key=itemgetter(0))
+    return [player for _, player in keyed]
+
+
+def _build_future_roster(roster, team_game_map: dict[str, Game]) -> list[DailyMatchupFuturePlayer]:
+    """Build a future day roster: players with games first, then without (by name)."""
+    keyed = []
+    for p in roster:
+        game = team_game_map.get(p.team)
+        has_game = game is not None
+        opponent = None
+        game_time = None
+        if game:
+            if game.home_team_id == p.team:
+                opponent = f"vs {game.away_team_id}"
+            else:
+                opponent = f"@ {game.home_team_id}"
+            game_time = str(game.start_time_et) if game.start_time_et else None
+        sort_key = (0 if has_game else 1, p.name)
+        keyed.append((sort_key, DailyMatchupFuturePlayer.model_construct(
+            player_id=p.player_id,
+            name=p.name,
+            team=p.team,
+            position=p.position,
+            has_game=has_game,
+            opponent=opponent,
+            game_time_et=game_time,
+            injured=p.injured,
+            injury_status=p.injury_status,
+        )))
+    keyed.sort(key=itemgetter(0))
+    return [player for _, player in keyed]
+
+
+def _build_day_teams(md, your_roster, opp_roster, with_totals: bool) -> tuple[DailyMatchupTeam, DailyMatchupTeam]:
+    """Wrap both day rosters in DailyMatchupTeam, totalling fpts for past/today."""
+    def team(src, roster):
+        total = None
+        if with_totals:
+            total = float(math.fsum([p.fpts for p in roster if p.fpts is not None]))
+        return DailyMatchupTeam(
+            team_name=src.team_name,
+            team_id=src.team_id,
+            total_fpts=total,
+            roster=roster,
+        )
+    return team(md.your_team, your_roster), team(md.opponent_team, opp_roster)
 
 
 class MatchupService:
@@ -96,38 +272,38 @@ class MatchupService:
         Fetches the current matchup (ESPN/Yahoo scores + roster) then overlays
         live stats from live_player_stats for each roster player matched by name.
         """
-        import pytz
-        from db.models.nba.live_player_stats import LivePlayerStats as LiveStatsModel
-
-        eastern = pytz.timezone("US/Eastern")
-        now_et = datetime.now(eastern)
-
         # NBA date convention: before 6 AM ET counts as yesterday.
         # This matches how the live pipeline stores records and ensures
         # we don't prematurely advance to the next day after midnight.
-        nba_today = (now_et - timedelta(days=1)).date() if now_et.hour < 6 else now_et.date()
+        nba_today = _get_nba_today()
 
         # Step 1: Fetch ESPN — always use the default (current) scoring period.
         # We trust whatever ESPN returns as the current roster and lineup.
-        matchup = await MatchupService.get_matchup_by_team_id(user_id, team_id, avg_window="season")
+        # The team's most recent baseline snapshot is loaded alongside it; it
+        # is almost always from ESPN's current matchup period.
+        matchup, latest_baseline = await asyncio.gather(
+            MatchupService.get_matchup_by_team_id(user_id, team_id, avg_window="season"),
+            asyncio.to_thread(DailyMatchupScore.get_latest_baseline, team_id),
+        )
 
         if matchup.status != ApiStatus.SUCCESS or not matchup.data:
             return LiveMatchupResp(status=matchup.status, message=matchup.message, data=None)
 
-        espn_matchup_period = matchup.data.matchup_period
-        espn_scoring_period = matchup.data.scoring_period_id
-
-        # Step 2: Query the latest DailyMatchupScore baseline for this matchup period.
-        baseline = (
-            DailyMatchupScore
-            .select()
-            .where(
-                (DailyMatchupScore.team_id == team_id) &
-                (DailyMatchupScore.matchup_period == espn_matchup_period)
+        md = matchup.data
+        your = md.your_team
+        opponent = md.opponent_team
+        espn_matchup_period = md.matchup_period
+        espn_scoring_period = md.scoring_period_id
+
+        # Step 2: Resolve the latest DailyMatchupScore baseline for this
+        # matchup period. The snapshot loaded in step 1 is it unless it
+        # belongs to another period (e.g. ESPN hasn't flipped yet).
+        if latest_baseline is None or latest_baseline.matchup_period == espn_matchup_period:
+            baseline = latest_baseline
+        else:
+            baseline = await asyncio.to_thread(
+                DailyMatchupScore.get_latest_baseline, team_id, espn_matchup_period
             )
-            .order_by(DailyMatchupScore.date.desc())
-            .first()
-        )
 
         # Step 3: Determine base scores and live overlay date.
         #
@@ -173,8 +349,8 @@ class MatchupService:
             # the baseline already includes nba_today's games — no overlay needed.
             baseline_excludes_nba_today = baseline.date <= nba_today
         else:
-            your_base = matchup.data.your_team.current_score
-            opponent_base = matchup.data.opponent_team.current_score
+            your_base = your.current_score
+            opponent_base = opponent.current_score
             baseline_excludes_nba_today = False
 
         # Include live overlay only when nba_today's games aren't yet in the
@@ -182,40 +358,60 @@ class MatchupService:
         # Use the matchup's actual date range (already correctly spanning 2 weeks
         # for playoff periods) rather than comparing local-schedule week numbers,
         # which diverge from ESPN's matchup period IDs during playoffs.
+        all_roster = your.roster + opponent.roster
         include_live = False
         if (
             baseline_excludes_nba_today
-            and matchup.data.matchup_period_start
-            and matchup.data.matchup_period_end
+            and all_roster
+            and md.matchup_period_start
+            and md.matchup_period_end
         ):
-            mp_start = date_type.fromisoformat(matchup.data.matchup_period_start)
-            mp_end = date_type.fromisoformat(matchup.data.matchup_period_end)
+            mp_start = date_type.fromisoformat(md.matchup_period_start)
+            mp_end = date_type.fromisoformat(md.matchup_period_end)
             include_live = mp_start <= game_date <= mp_end
 
+        # Normalize each roster name once; reused for the fallback query and
+        # the per-player lookups in build_live_roster.
+        norm_names = {p.player_id: p.name.lower().strip() for p in all_roster}
+
+        # Live stats are only queried when the overlay applies.
         if include_live:
-            all_espn_ids = [
-                p.player_id for p in matchup.data.your_team.roster + matchup.data.opponent_team.roster
-            ]
-            live_stats_list = LiveStatsModel.get_live_stats_by_espn_ids(all_espn_ids, game_date)
+            all_espn_ids = [p.player_id for p in all_roster]
+            live_stats_list = await asyncio.to_thread(
+                LivePlayerStats.get_live_stats_by_espn_ids, all_espn_ids, game_date
+            )
             espn_id_to_live = {stat.player.espn_id: stat for stat in live_stats_list}
 
             # Name-based fallback for players without espn_id mapping
             unresolved_names = [
-                p.name for p in matchup.data.your_team.roster + matchup.data.opponent_team.roster
+                norm_names[p.player_id] for p in all_roster
                 if p.player_id not in espn_id_to_live
             ]
             name_to_live: dict[str, object] = {}
             if unresolved_names:
-                fallback_stats = LiveStatsModel.get_live_stats_by_names(unresolved_names, game_date)
+                fallback_stats = await asyncio.to_thread(
+                    LivePlayerStats.get_live_stats_by_names, unresolved_names, game_date
+                )
                 name_to_live = {stat.player.name_normalized: stat for stat in fallback_stats}
         else:
             espn_id_to_live = {}
             name_to_live = {}
 
-        def build_live_roster(roster) -> list[LiveMatchupPlayer]:
+        def build_live_roster(roster) -> tuple[list[LiveMatchupPlayer], float]:
+            """
+            Overlay live stats on a roster and total today's live fpts for
+            active roster players (not BE/IR) in the same pass. Both
+            in-progress (status 2) and final (status 3) games count because
+            the baseline is a morning snapshot captured before any games
+            start — tonight's finished games are NOT yet reflected in it. The
+            live pipeline cleans up stale records from previous game days on
+            each run, so all records in live_player_stats are from today only.
+            With no live stats matched, today_fpts is 0.
+            """
             result = []
+            today_fpts = 0
             for p in roster:
-                stat = espn_id_to_live.get(p.player_id) or name_to_live.get(p.name.lower().strip())
+                stat = espn_id_to_live.get(p.player_id) or name_to_live.get(norm_names[p.player_id])
                 live_overlay = None
                 if stat:
                     # Read-side staleness defense: if game_status is still 2
@@ -244,44 +440,28 @@ class MatchupService:
                         game_clock=effective_clock,
                         last_updated=stat.last_updated.isoformat() if stat.last_updated else None,
                     )
-                result.append(LiveMatchupPlayer(**p.model_dump(), live=live_overlay))
-            return result
-
-        def compute_live_score(base: float, live_roster: list[LiveMatchupPlayer]) -> float:
-            """
-            Add today's live fpts for active roster players (not BE/IR) on
-            top of the pipeline baseline score. Both in-progress (status 2)
-            and final (status 3) games are included because the baseline is
-            a morning snapshot captured before any games start — tonight's
-            finished games are NOT yet reflected in it. The live pipeline
-            cleans up stale records from previous game days on each run, so
-            all records in live_player_stats are from today only.
-            With name_to_live={}, today_fpts=0 and base is returned unchanged.
-            """
-            today_fpts = sum(
-                p.live.live_fpts
-                for p in live_roster
-                if p.lineup_slot not in ("BE", "IR")
-                and p.live is not None
-                and p.live.game_status >= 2
-            )
-            return round(base + today_fpts, 2)
+                    if effective_status >= 2 and p.lineup_slot not in _BENCH_SLOTS:
+                        today_fpts += stat.fpts
+                # Roster entries are already-validated MatchupPlayerResp models;
+                # construct the subclass directly from their fields.
+                result.append(LiveMatchupPlayer.model_construct(**p.__dict__, live=live_overlay))
+            return result, today_fpts
 
-        your_live_roster = build_live_roster(matchup.data.your_team.roster)
-        opponent_live_roster = build_live_roster(matchup.data.opponent_team.roster)
+        your_live_roster, your_today_fpts = build_live_roster(your.roster)
+        opponent_live_roster, opponent_today_fpts = build_live_roster(opponent.roster)
 
         your_team = LiveMatchupTeam(
-            team_name=matchup.data.your_team.team_name,
-            team_id=matchup.data.your_team.team_id,
-            current_score=compute_live_score(your_base, your_live_roster),
-            projected_score=matchup.data.your_team.projected_score,
+            team_name=your.team_name,
+            team_id=your.team_id,
+            current_score=round(your_base + your_today_fpts, 2),
+            projected_score=your.projected_score,
             roster=your_live_roster,
         )
         opponent_team = LiveMatchupTeam(
-            team_name=matchup.data.opponent_team.team_name,
-            team_id=matchup.data.opponent_team.team_id,
-            current_score=compute_live_score(opponent_base, opponent_live_roster),
-            projected_score=matchup.data.opponent_team.projected_score,
+            team_name=opponent.team_name,
+            team_id=opponent.team_id,
+            current_score=round(opponent_base + opponent_today_fpts, 2),
+            projected_score=opponent.projected_score,
             roster=opponent_live_roster,
         )
 
@@ -289,13 +469,13 @@ class MatchupService:
             status=ApiStatus.SUCCESS,
             message="Live matchup data fetched successfully",
             data=LiveMatchupData(
-                matchup_period=matchup.data.matchup_period,
-                matchup_period_start=matchup.data.matchup_period_start,
-                matchup_period_end=matchup.data.matchup_period_end,
+                matchup_period=md.matchup_period,
+                matchup_period_start=md.matchup_period_start,
+                matchup_period_end=md.matchup_period_end,
                 your_team=your_team,
                 opponent_team=opponent_team,
-                projected_winner=matchup.data.projected_winner,
-                projected_margin=matchup.data.projected_margin,
+                projected_winner=md.projected_winner,
+                projected_margin=md.projected_margin,
                 game_date=str(game_date),
             ),
         )
@@ -316,51 +496,46 @@ class MatchupService:
             MatchupScoreHistoryResp with daily score snapshots for charting
         """
         try:
-            query = (
-                DailyMatchupScore
-                .select()
-                .where(DailyMatchupScore.team_id == team_id)
-            )
-
             if matchup_period is not None:
-                query = query.where(DailyMatchupScore.matchup_period == matchup_period)
+                period_filter = DailyMatchupScore.matchup_period == matchup_period
             else:
-                # Get the latest matchup period for this team
-                latest = (
-                    DailyMatchupScore
-                    .select(DailyMatchupScore.matchup_period)
-                    .where(DailyMatchupScore.team_id == team_id)
-                    .order_by(DailyMatchupScore.matchup_period.desc())
-                    .limit(1)
-                    .first()
+                # Latest matchup period for this team, resolved in the same query
+                latest = DailyMatchupScore.alias()
+                latest_period = (
+                    latest
+                    .select(fn.MAX(latest.matchup_period))
+                    .where(latest.team_id == team_id)
                 )
-                if not latest:
-                    return MatchupScoreHistoryResp(
-                        status=ApiStatus.NOT_FOUND,
-                        message="No score history found for this team",
-                        data=None
-                    )
-                query = query.where(DailyMatchupScore.matchup_period == latest.matchup_period)
+                period_filter = DailyMatchupScore.matchup_period == latest_period
 
-            records = list(query.order_by(DailyMatchupScore.day_of_matchup.asc()))
+            records = list(
+                DailyMatchupScore
+                .select()
+                .where((DailyMatchupScore.team_id == team_id) & period_filter)
+                .order_by(DailyMatchupScore.day_of_matchup.asc())
+            )
 
             if not records:
                 return MatchupScoreHistoryResp(
                     status=ApiStatus.NOT_FOUND,
-                    message="No score history found for this matchup period",
+                    message=(
+                        "No score history found for this team"
+                        if matchup_period is None
+                        else "No score history found for this matchup period"
+                    ),
                     data=None
                 )
 
             first_record = records[0]
-            history = [
-                DailyScorePoint(
-                    date=record.date.isoformat(),
-                    day_of_matchup=record.day_of_matchup,
-                    your_score=float(record.current_score),
-                    opponent_score=float(record.opponent_current_score)
-                )
+            history = _HISTORY_ADAPTER.validate_python([
+                {
+                    "date": record.date.isoformat(),
+                    "day_of_matchup": record.day_of_matchup,
+                    "your_score": float(record.current_score),
+                    "opponent_score": float(record.opponent_current_score),
+                }
                 for record in records
-            ]
+            ])
 
             return MatchupScoreHistoryResp(
                 status=ApiStatus.SUCCESS,
@@ -393,13 +568,13 @@ class MatchupService:
         For past dates: returns player box score stats from player_game_stats.
         For future dates: returns which players have games scheduled.
         """
-        import pytz
-        from db.models.nba.players import Player
-        from db.models.nba.player_game_stats import PlayerGameStats
-        from db.models.nba.games import Game
-
-        # 1. Fetch current matchup to get both rosters and matchup period
-        matchup = await MatchupService.get_matchup_by_team_id(user_id, team_id, avg_window="season")
+        # 1. Fetch current matchup to get both rosters and matchup period.
+        #    Games on the target date only depend on the date, so fetch them
+        #    concurrently with the provider call.
+        matchup, games_on_date = await asyncio.gather(
+            MatchupService.get_matchup_by_team_id(user_id, team_id, avg_window="season"),
+            asyncio.to_thread(_get_games_on_date, target_date),
+        )
 
         if matchup.status != ApiStatus.SUCCESS or not matchup.data:
             return DailyMatchupResp(status=matchup.status, message=matchup.message, data=None)
@@ -427,9 +602,7 @@ class MatchupService:
         #    previous evening). This matches how the live pipeline stores
         #    records and prevents the day from advancing prematurely after
         #    midnight when ESPN has flipped but games may still be in progress.
-        eastern = pytz.timezone("US/Eastern")
-        now_et = datetime.now(eastern)
-        today = (now_et - timedelta(days=1)).date() if now_et.hour < 6 else now_et.date()
+        today = _get_nba_today()
 
         if target_date < today:
             day_type = "past"
@@ -440,64 +613,43 @@ class MatchupService:
 
         day_index = (target_date - period_start).days
 
-        # 4. Resolve roster players → NBA player IDs via espn_id (primary)
-        #    with name-based fallback for any players missing espn_id mapping.
         all_roster = md.your_team.roster + md.opponent_team.roster
-        espn_ids = [p.player_id for p in all_roster]
-        players_by_espn = list(Player.select().where(
-            Player.espn_id.in_(espn_ids)
-        ))
-        espn_to_nba = {p.espn_id: p.id for p in players_by_espn}
-
-        # Name-based fallback for players not resolved via espn_id
-        unresolved_names = [
-            p.name.lower().strip() for p in all_roster
-            if p.player_id not in espn_to_nba
-        ]
-        name_to_nba: dict[str, int] = {}
-        if unresolved_names:
-            players_by_name = list(Player.select().where(
-                Player.name_normalized.in_(unresolved_names)
-            ))
-            name_to_nba = {p.name_normalized: p.id for p in players_by_name}
 
-        def resolve_nba_id(roster_player) -> int | None:
-            """Resolve a roster player to an NBA player ID. ESPN ID first, then name."""
-            nba_id = espn_to_nba.get(roster_player.player_id)
-            if nba_id:
-                return nba_id
-            return name_to_nba.get(roster_player.name.lower().strip())
+        if day_type in ("past", "today"):
+            # 4. Teams with a game on the target date
+            teams_playing = {
+                team
+                for game in games_on_date
+                for team in (game.home_team_id, game.away_team_id)
+            }
+
+            # 5. Resolve roster players → NBA player IDs via espn_id (primary)
+            #    with name-based fallback, and pull their box scores for the
+            #    target date in the same query. The LEFT JOIN keeps players
+            #    without a game so they still resolve to an NBA ID.
+            norm_names = {p.player_id: p.name.lower().strip() for p in all_roster}
+            espn_to_nba, name_to_nba, nba_id_to_stats = _resolve_players_with_day_stats(
+                [p.player_id for p in all_roster],
+                list(norm_names.values()),
+                target_date,
+            )
 
-        # 5. Get games on the target date
-        games_on_date = Game.get_games_on_date(target_date)
-        teams_playing = set()
-        # Build team → game mapping for opponent info
-        team_game_map: dict[str, Game] = {}
-        for game in games_on_date:
-            teams_playing.add(game.home_team_id)
-            teams_playing.add(game.away_team_id)
-            team_game_map[game.home_team_id] = game
-            team_game_map[game.away_team_id] = game
+            def resolve_nba_id(roster_player) -> int | None:
+                """Resolve a roster player to an NBA player ID. ESPN ID first, then name."""
+                nba_id = espn_to_nba.get(roster_player.player_id)
+                if nba_id:
+                    return nba_id
+                return name_to_nba.get(norm_names[roster_player.player_id])
 
-        if day_type in ("past", "today"):
-            # 6a. Past/today: look up player stats
+            # 6a. Past/today: build rosters from the resolved stats
             nba_ids = [resolve_nba_id(p) for p in all_roster]
             nba_ids = [nid for nid in nba_ids if nid is not None]
-            stats_list = list(
-                PlayerGameStats.select()
-                .where(
-                    (PlayerGameStats.player_id.in_(nba_ids))
-                    & (PlayerGameStats.game_date == target_date)
-                )
-            ) if nba_ids else []
-            nba_id_to_stats = {s.player_id: s for s in stats_list}
 
             # For today: overlay live stats for players not yet in PlayerGameStats.
             # The nightly pipeline hasn't run yet, so PlayerGameStats is empty for
             # today — pull from the live_player_stats table instead (same source
             # the live matchup endpoint uses).
             if day_type == "today" and nba_ids:
-                from db.models.nba.live_player_stats import LivePlayerStats
                 live_stats_list = list(
                     LivePlayerStats.select()
                     .where(
@@ -509,105 +661,21 @@ class MatchupService:
                     if ls.player_id not in nba_id_to_stats:
                         nba_id_to_stats[ls.player_id] = ls
 
-            def build_past_roster(roster) -> list[DailyMatchupPlayerStats]:
-                result = []
-                for p in roster:
-                    nba_id = resolve_nba_id(p)
-                    had_game = p.team in teams_playing
-                    stats = nba_id_to_stats.get(nba_id) if nba_id else None
-                    result.append(DailyMatchupPlayerStats(
-                        player_id=p.player_id,
-                        name=p.name,
-                        team=p.team,
-                        position=p.position,
-                        nba_player_id=nba_id,
-                        had_game=had_game,
-                        fpts=stats.fpts if stats else None,
-                        pts=stats.pts if stats else None,
-                        reb=stats.reb if stats else None,
-                        ast=stats.ast if stats else None,
-                        stl=stats.stl if stats else None,
-                        blk=stats.blk if stats else None,
-                        tov=stats.tov if stats else None,
-                        min=stats.min if stats else None,
-                        fgm=stats.fgm if stats else None,
-                        fga=stats.fga if stats else None,
-                        fg3m=stats.fg3m if stats else None,
-                        fg3a=stats.fg3a if stats else None,
-                        ftm=stats.ftm if stats else None,
-                        fta=stats.fta if stats else None,
-                    ))
-                # Sort: players with stats first (by fpts desc), then had_game but no stats, then no game
-                result.sort(key=lambda x: (
-                    0 if x.fpts is not None else (1 if x.had_game else 2),
-                    -(x.fpts or 0),
-                ))
-                return result
-
-            your_roster = build_past_roster(md.your_team.roster)
-            opp_roster = build_past_roster(md.opponent_team.roster)
-
-            your_total = sum(p.fpts for p in your_roster if p.fpts is not None)
-            opp_total = sum(p.fpts for p in opp_roster if p.fpts is not None)
-
-            your_team = DailyMatchupTeam(
-                team_name=md.your_team.team_name,
-                team_id=md.your_team.team_id,
-                total_fpts=float(your_total),
-                roster=your_roster,
-            )
-            opponent_team = DailyMatchupTeam(
-                team_name=md.opponent_team.team_name,
-                team_id=md.opponent_team.team_id,
-                total_fpts=float(opp_total),
-                roster=opp_roster,
-            )
+            your_roster = _build_past_roster(md.your_team.roster, resolve_nba_id, teams_playing, nba_id_to_stats)
+            opp_roster = _build_past_roster(md.opponent_team.roster, resolve_nba_id, teams_playing, nba_id_to_stats)
+            your_team, opponent_team = _build_day_teams(md, your_roster, opp_roster, with_totals=True)
 
         else:
-            # 6b. Future: show which players have games
-            def build_future_roster(roster) -> list[DailyMatchupFuturePlayer]:
-                result = []
-                for p in roster:
-                    game = team_game_map.get(p.team)
-                    has_game = game is not None
-                    opponent = None
-                    game_time = None
-                    if game:
-                        if game.home_team_id == p.team:
-                            opponent = f"vs {game.away_team_id}"
-                        else:
-                            opponent = f"@ {game.home_team_id}"
-                        game_time = str(game.start_time_et) if game.start_time_et else None
-                    result.append(DailyMatchupFuturePlayer(
-                        player_id=p.player_id,
-                        name=p.name,
-                        team=p.team,
-                        position=p.position,
-                        has_game=has_game,
-                        opponent=opponent,
-                        game_time_et=game_time,
-                        injured=p.injured,
-                        injury_status=p.injury_status,
-                    ))
-                # Players with games first, then without
-                result.sort(key=lambda x: (0 if x.has_game else 1, x.name))
-                return result
-
-            your_roster = build_future_roster(md.your_team.roster)
-            opp_roster = build_future_roster(md.opponent_team.roster)
-
-            your_team = DailyMatchupTeam(
-                team_name=md.your_team.team_name,
-                team_id=md.your_team.team_id,
-                total_fpts=None,
-                roster=your_roster,
-            )
-            opponent_team = DailyMatchupTeam(
-                team_name=md.opponent_team.team_name,
-                team_id=md.opponent_team.team_id,
-                total_fpts=None,
-                roster=opp_roster,
-            )
+            # 6b. Future: show which players have games. Build team → game
+            #     mapping for opponent info.
+            team_game_map: dict[str, Game] = {}
+            for game in games_on_date:
+                team_game_map[game.home_team_id] = game
+                team_game_map[game.away_team_id] = game
+
+            your_roster = _build_future_roster(md.your_team.roster, team_game_map)
+            opp_roster = _build_future_roster(md.opponent_team.roster, team_game_map)
+            your_team, opponent_team = _build_day_teams(md, your_roster, opp_roster, with_totals=False)
 
         return DailyMatchupResp(
             status=ApiStatus.SUCCESS,
@@ -637,12 +705,6 @@ class MatchupService:
         required DB data for the entire period before building per-day responses.
         This replaces N parallel getDailyMatchup calls from the frontend.
         """
-        import pytz
-        from db.models.nba.players import Player
-        from db.models.nba.player_game_stats import PlayerGameStats
-        from db.models.nba.live_player_stats import LivePlayerStats
-        from db.models.nba.games import Game
-
         # 1. ONE ESPN/Yahoo call for the whole week
         matchup = await MatchupService.get_matchup_by_team_id(user_id, team_id, avg_window="season")
 
@@ -664,9 +726,7 @@ class MatchupService:
         ]
 
         # 2. NBA date convention: before 6 AM ET counts as yesterday
-        eastern = pytz.timezone("US/Eastern")
-        now_et = datetime.now(eastern)
-        nba_today = (now_et - timedelta(days=1)).date() if now_et.hour < 6 else now_et.date()
+        nba_today = _get_nba_today()
 
         # 3. Resolve all roster players → NBA IDs once for the whole week
         all_roster = md.your_team.roster + md.opponent_team.roster
@@ -766,100 +826,13 @@ class MatchupService:
                         if live:
                             nba_id_to_stats[nba_id] = live
 
-                def build_past_roster(roster) -> list[DailyMatchupPlayerStats]:
-                    result = []
-                    for p in roster:
-                        nba_id = resolve_nba_id(p)
-                        had_game = p.team in teams_playing
-                        stats = nba_id_to_stats.get(nba_id) if nba_id else None
-                        result.append(DailyMatchupPlayerStats(
-                            player_id=p.player_id,
-                            name=p.name,
-                            team=p.team,
-                            position=p.position,
-                            nba_player_id=nba_id,
-                            had_game=had_game,
-                            fpts=stats.fpts if stats else None,
-                            pts=stats.pts if stats else None,
-                            reb=stats.reb if stats else None,
-                            ast=stats.ast if stats else None,
-                            stl=stats.stl if stats else None,
-                            blk=stats.blk if stats else None,
-                            tov=stats.tov if stats else None,
-                            min=stats.min if stats else None,
-                            fgm=stats.fgm if stats else None,
-                            fga=stats.fga if stats else None,
-                            fg3m=stats.fg3m if stats else None,
-                            fg3a=stats.fg3a if stats else None,
-                            ftm=stats.ftm if stats else None,
-                            fta=stats.fta if stats else None,
-                        ))
-                    result.sort(key=lambda x: (
-                        0 if x.fpts is not None else (1 if x.had_game else 2),
-                        -(x.fpts or 0),
-                    ))
-                    return result
-
-                your_roster = build_past_roster(md.your_team.roster)
-                opp_roster = build_past_roster(md.opponent_team.roster)
-                your_total = sum(p.fpts for p in your_roster if p.fpts is not None)
-                opp_total = sum(p.fpts for p in opp_roster if p.fpts is not None)
-
-                your_team = DailyMatchupTeam(
-                    team_name=md.your_team.team_name,
-                    team_id=md.your_team.team_id,
-                    total_fpts=float(your_total),
-                    roster=your_roster,
-                )
-                opponent_team = DailyMatchupTeam(
-                    team_name=md.opponent_team.team_name,
-                    team_id=md.opponent_team.team_id,
-                    total_fpts=float(opp_total),
-                    roster=opp_roster,
-                )
-
+                your_roster = _build_past_roster(md.your_team.roster, resolve_nba_id, teams_playing, nba_id_to_stats)
+                opp_roster = _build_past_roster(md.opponent_team.roster, resolve_nba_id, teams_playing, nba_id_to_stats)
+                your_team, opponent_team = _build_day_teams(md, your_roster, opp_roster, with_totals=True)
             else:
-                def build_future_roster(roster) -> list[DailyMatchupFuturePlayer]:
-                    result = []
-                    for p in roster:
-                        game = team_game_map.get(p.team)
-                        has_game = game is not None
-                        opponent = None
-                        game_time = None
-                        if game:
-                            if game.home_team_id == p.team:
-                                opponent = f"vs {game.away_team_id}"
-                            else:
-                                opponent = f"@ {game.home_team_id}"
-                            game_time = str(game.start_time_et) if game.start_time_et else None
-                        result.append(DailyMatchupFuturePlayer(
-                            player_id=p.player_id,
-                            name=p.name,
-                            team=p.team,
-                            position=p.position,
-                            has_game=has_game,
-                            opponent=opponent,
-                            game_time_et=game_time,
-                            injured=p.injured,
-                            injury_status=p.injury_status,
-                        ))
-                    result.sort(key=lambda x: (0 if x.has_game else 1, x.name))
-                    return result
-
-                your_roster = build_future_roster(md.your_team.roster)
-                opp_roster = build_future_roster(md.opponent_team.roster)
-                your_team = DailyMatchupTeam(
-                    team_name=md.your_team.team_name,
-                    team_id=md.your_team.team_id,
-                    total_fpts=None,
-                    roster=your_roster,
-                )
-                opponent_team = DailyMatchupTeam(
-                    team_name=md.opponent_team.team_name,
-                    team_id=md.opponent_team.team_id,
-                    total_fpts=None,
-                    roster=opp_roster,
-                )
+                your_roster = _build_future_roster(md.your_team.roster, team_game_map)
+                opp_roster = _build_future_roster(md.opponent_team.roster, team_game_map)
+                your_team, opponent_team = _build_day_teams(md, your_roster, opp_roster, with_totals=False)
 
             return DailyMatchupData(
                 date=target_date.isoformat(),
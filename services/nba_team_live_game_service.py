@@ -2,6 +2,7 @@
 Service for NBA team live/upcoming game data.
 """
 
+import asyncio
 from datetime import date, datetime, timedelta
 
 import pytz
@@ -168,7 +169,7 @@ class NBATeamLiveGameService:
                     try:
                         from pipelines.extractors.nba_api import NBAApiExtractor
                         extractor = NBAApiExtractor()
-                        box = extractor.get_live_box_score(g.game_id)
+                        box = await asyncio.to_thread(extractor.get_live_box_score, g.game_id)
                         if box:
                             # box is already the unwrapped inner game dict
                             game_data = box
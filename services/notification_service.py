@@ -9,6 +9,8 @@ import json
 from dataclasses import dataclass
 from typing import Optional
 
+import orjson
+
 from core.logging import get_logger
 from core.settings import settings
 
@@ -75,7 +77,7 @@ class NotificationService:
         """
         # Parse team name from league_info JSON
         try:
-            league_info = json.loads(team.league_info)
+            league_info = orjson.loads(team.league_info)
             team_name = league_info.get("team_name", "Your Team")
         except (json.JSONDecodeError, AttributeError):
             team_name = "Your Team"
@@ -2,11 +2,17 @@
 Service for lineup optimization via features service.
 """
 
+import asyncio
+import hashlib
+
 import httpx
+import orjson
 
+from core.features_client import GENERATE_LINEUP_PATH, get_features_client
 from core.logging import get_logger
 from db.models import Team
 from schemas.common import ApiStatus
+from schemas.espn import PLAYER_LIST_ADAPTER, PlayerResp
 from schemas.optimize import (
     OptimizeResp,
     OptimizeData,
@@ -16,14 +22,69 @@ from schemas.optimize import (
     PlayerInput,
 )
 from services.lineup_service import LineupService
-from utils.constants import FEATURES_SERVER_ENDPOINT
+
+
+def _build_payload(
+    roster_players: list[PlayerResp],
+    fa_players: list[PlayerResp],
+    request: GenerateLineupRequest,
+) -> bytes:
+    """Serialize the generate-lineup request body for the features service."""
+    return orjson.dumps({
+        "roster_data": PLAYER_LIST_ADAPTER.dump_python(roster_players),
+        "free_agent_data": PLAYER_LIST_ADAPTER.dump_python(fa_players),
+        "streaming_slots": request.streaming_slots,
+        "week": request.week,
+    })
+
+
+# Identical generate-lineup requests in flight, keyed by a hash of the request
+# body. Concurrent duplicates (double-clicks, retries) share one upstream call.
+_inflight: dict[bytes, asyncio.Task] = {}
+
+# Response size above which parsing + transforming is worth a thread hop
+_TRANSFORM_IN_THREAD_BYTES = 64 * 1024
+
+
+async def _post_generate_lineup(payload: bytes) -> bytes:
+    """POST a serialized request to the features service and return the raw body."""
+    client = get_features_client()
+    response = await client.post(
+        GENERATE_LINEUP_PATH,
+        content=payload,
+        headers={"Content-Type": "application/json"},
+    )
+    response.raise_for_status()
+    return response.content
+
+
+def _generate_lineup_shared(payload: bytes) -> asyncio.Future:
+    """
+    Return an awaitable for the features-service response to this payload,
+    joining an identical in-flight request if there is one.
+
+    The shared task is shielded so one caller being cancelled doesn't cancel
+    the request for the others.
+    """
+    key = hashlib.blake2b(payload, digest_size=16).digest()
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_post_generate_lineup(payload))
+        _inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            _inflight.pop(key, None)
+            # Mark the exception retrieved in case every caller was cancelled
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+    return asyncio.shield(task)
 
 
 class OptimizeService:
     """Service for lineup optimization."""
 
-    FEATURES_TIMEOUT = 30.0  # seconds
-
     @staticmethod
     async def optimize_from_team(api_key, request: GenerateLineupRequest) -> OptimizeResp:
         """
@@ -49,16 +110,12 @@ class OptimizeService:
             return OptimizeResp(status=ApiStatus.ERROR, message=str(e), data=None)
 
         try:
-            payload = {
-                "roster_data": [p.model_dump() for p in roster_players],
-                "free_agent_data": [p.model_dump() for p in fa_players],
-                "streaming_slots": request.streaming_slots,
-                "week": request.week,
-            }
+            # Serialize off the event loop; roster + free agent lists can be large
+            payload = await asyncio.to_thread(_build_payload, roster_players, fa_players, request)
 
             log.info(
                 "calling_features_service_from_team",
-                endpoint=f"{FEATURES_SERVER_ENDPOINT}/generate-lineup",
+                endpoint=GENERATE_LINEUP_PATH,
                 week=request.week,
                 team_id=request.team_id,
                 roster_size=len(roster_players),
@@ -67,15 +124,16 @@ class OptimizeService:
                 use_recent_stats=request.use_recent_stats,
             )
 
-            async with httpx.AsyncClient(timeout=OptimizeService.FEATURES_TIMEOUT) as client:
-                response = await client.post(
-                    f"{FEATURES_SERVER_ENDPOINT}/generate-lineup",
-                    json=payload,
-                )
-                response.raise_for_status()
-                result = response.json()
+            body = await _generate_lineup_shared(payload)
 
-            optimize_data = OptimizeService._transform_v2_response(result, request.week)
+            # Large responses (long weeks, many moves) are parsed and
+            # transformed off the event loop so other requests keep flowing
+            if len(body) > _TRANSFORM_IN_THREAD_BYTES:
+                result, optimize_data = await asyncio.to_thread(
+                    OptimizeService._parse_and_transform, body, request.week
+                )
+            else:
+                result, optimize_data = OptimizeService._parse_and_transform(body, request.week)
 
             log.info(
                 "optimization_from_team_complete",
@@ -90,6 +148,14 @@ class OptimizeService:
                 data=optimize_data,
             )
 
+        except (httpx.PoolTimeout, httpx.ConnectTimeout) as e:
+            log.error("features_service_unavailable", week=request.week, error=type(e).__name__)
+            return OptimizeResp(
+                status=ApiStatus.ERROR,
+                message="Optimization service is busy. Please try again shortly.",
+                data=None,
+            )
+
         except httpx.TimeoutException:
             log.error("features_service_timeout", week=request.week)
             return OptimizeResp(
@@ -114,6 +180,13 @@ class OptimizeService:
                 data=None,
             )
 
+    @staticmethod
+    def _parse_and_transform(body: bytes, week: int) -> tuple[dict, OptimizeData]:
+        """Parse a raw v2 response body and transform it, in one step so large
+        bodies need a single thread hop."""
+        result = orjson.loads(body)
+        return result, OptimizeService._transform_v2_response(result, week)
+
     @staticmethod
     def _transform_v2_response(result: dict, week: int) -> OptimizeData:
         """Transform v2 Go service response to OptimizeData schema.
@@ -121,42 +194,58 @@ class OptimizeService:
         v2 response shape:
           { Lineup: [{Day, Additions, Removals, Roster: {pos: {Name, AvgPoints, Team}}}],
             Improvement: int, Week: int, StreamingSlots: int, Timestamp: str }
+
+        The response comes from our own features service, so the nested models
+        are built with model_construct (no per-field validation).
+        tests/unit/test_optimize_transform.py checks the output still
+        validates against the full schema.
         """
         daily_lineups = []
         recommended_moves = []
 
-        lineup = result.get("Lineup", [])
-        total_moves = sum(len(gene.get("Additions", [])) for gene in lineup)
-        gain_per_move = result.get("Improvement", 0) / max(total_moves, 1)
-
-        for gene in lineup:
+        # Single pass over the lineup: build each day and collect its moves,
+        # counting additions as we go. Moves are emitted afterwards because
+        # the per-move gain depends on the total move count.
+        day_moves = []
+        total_moves = 0
+        for gene in result.get("Lineup", []):
             day = gene.get("Day", 0)
-            roster = gene.get("Roster", {})
+
+            active_players = []
+            projected_fpts = 0.0
+            for p in gene.get("Roster", {}).values():
+                active_players.append(p["Name"])
+                projected_fpts += p.get("AvgPoints", 0.0)
 
             daily_lineups.append(
-                OptimizedDay(
+                OptimizedDay.model_construct(
                     date=f"Week {week}, Day {day}",
-                    active_players=[p["Name"] for p in roster.values()],
+                    active_players=active_players,
                     bench_players=[],
-                    projected_fpts=sum(p.get("AvgPoints", 0.0) for p in roster.values()),
+                    projected_fpts=projected_fpts,
                 )
             )
 
             additions = gene.get("Additions", [])
-            removals = gene.get("Removals", [])
+            total_moves += len(additions)
+            day_moves.append((day, additions, gene.get("Removals", [])))
+
+        gain_per_move = result.get("Improvement", 0) / max(total_moves, 1)
+
+        for day, additions, removals in day_moves:
             for i, add in enumerate(additions):
                 drop = removals[i] if i < len(removals) else None
                 recommended_moves.append(
-                    RecommendedMove(
+                    RecommendedMove.model_construct(
                         action="stream",
-                        player_add=PlayerInput(
+                        player_add=PlayerInput.model_construct(
                             id=0,
                             name=add["Name"],
                             team=add["Team"],
                             position="",
                             avg_fpts=add.get("AvgPoints", 0.0),
                         ),
-                        player_drop=PlayerInput(
+                        player_drop=PlayerInput.model_construct(
                             id=0,
                             name=drop["Name"],
                             team=drop["Team"],
@@ -2,8 +2,15 @@
 Service for ownership trend operations.
 """
 
+import asyncio
+import heapq
+import time
 from datetime import datetime, timedelta
+from operator import attrgetter
+
+import numpy as np
 import pytz
+from peewee import fn
 
 from core.logging import get_logger
 from db.models.nba.players import Player
@@ -19,6 +26,112 @@ from schemas.ownership import (
 from schemas.player import PlayerOwnershipData, PlayerOwnershipResp
 
 
+# Trending results only change when a new ownership snapshot lands (once a
+# day), so they are cached per argument set and snapshot date. The TTL
+# bounds staleness if a snapshot is re-ingested for the same date.
+_TRENDING_TTL_SECONDS = 15 * 60
+_TRENDING_MAX_ENTRIES = 256
+_trending_cache: dict[tuple, tuple[float, OwnershipTrendingData]] = {}
+
+
+def _compute_changes(
+    current_data: dict[int, float],
+    past_data: dict[int, float],
+    min_ownership: float,
+    min_change: float,
+) -> list[dict]:
+    """
+    Compute ownership change and velocity for every player in the current snapshot.
+
+    Vectorized over the whole snapshot with NumPy; only players passing the
+    ownership and change filters are turned into dicts.
+
+    Velocity is relative change: (current - past) / past * 100. Players with
+    no past ownership get +100 when rising and -100 otherwise.
+
+    Returns:
+        List of {player_id, current, past, change, velocity} dicts, in
+        current-snapshot order
+    """
+    if not current_data:
+        return []
+
+    count = len(current_data)
+    pids = np.fromiter(current_data.keys(), dtype=np.int64, count=count)
+    current = np.fromiter(current_data.values(), dtype=np.float64, count=count)
+    past = np.fromiter(
+        (past_data.get(pid, 0.0) for pid in current_data), dtype=np.float64, count=count
+    )
+    change = current - past
+
+    # Divide only where there is a baseline; the rest get +/-100
+    ratio = np.divide(change, past, out=np.zeros_like(change), where=past > 0)
+    velocity = np.where(past > 0, ratio * 100, np.where(change > 0, 100.0, -100.0))
+
+    # Apply minimum ownership filter to reduce noise from deep roster players
+    keep = ((current >= min_ownership) | (past >= min_ownership)) & (np.abs(change) >= min_change)
+    idx = np.flatnonzero(keep)
+
+    return [
+        {"player_id": pid, "current": cur, "past": pst, "change": chg, "velocity": vel}
+        for pid, cur, pst, chg, vel in zip(
+            pids[idx].tolist(),
+            current[idx].tolist(),
+            past[idx].tolist(),
+            change[idx].tolist(),
+            velocity[idx].tolist(),
+        )
+    ]
+
+
+def _fetch_player_names(player_ids: list[int]) -> dict[int, str]:
+    """Map player ID -> display name."""
+    return dict(
+        Player.select(Player.id, Player.name)
+        .where(Player.id.in_(player_ids))
+        .tuples()
+    )
+
+
+def _fetch_player_teams(player_ids: list[int]) -> dict[int, str]:
+    """Map player ID -> team, from latest season stats, falling back to most recent game."""
+    team_info = {}
+    if not player_ids:
+        return team_info
+
+    # Latest season-stats snapshot, resolved in the same query
+    latest = PlayerSeasonStats.alias()
+    latest_date = latest.select(fn.MAX(latest.as_of_date))
+    for pid, team_id in (
+        PlayerSeasonStats.select(PlayerSeasonStats.player, PlayerSeasonStats.team)
+        .where(
+            (PlayerSeasonStats.player_id.in_(player_ids))
+            & (PlayerSeasonStats.as_of_date == latest_date)
+            & (PlayerSeasonStats.team.is_null(False))
+        )
+        .tuples()
+    ):
+        team_info[pid] = team_id
+
+    # Fill missing teams from most recent game stats, one query for all
+    # missing players: DISTINCT ON keeps each player's latest game with a team
+    missing_ids = [pid for pid in player_ids if pid not in team_info]
+    if missing_ids:
+        for pid, team_id in (
+            PlayerGameStats.select(PlayerGameStats.player, PlayerGameStats.team)
+            .where(
+                (PlayerGameStats.player.in_(missing_ids))
+                & (PlayerGameStats.team.is_null(False))
+            )
+            .distinct(PlayerGameStats.player)
+            .order_by(PlayerGameStats.player, PlayerGameStats.game_date.desc())
+            .tuples()
+        ):
+            team_info[pid] = team_id
+
+    return team_info
+
+
 class OwnershipService:
     """Service for retrieving ownership trends."""
 
@@ -56,115 +169,87 @@ class OwnershipService:
             yesterday = datetime.now(central_tz).date() - timedelta(days=1)
             past_date = yesterday - timedelta(days=days)
 
-            # Get current and past ownership data
-            current_data = {
-                row.player_id: float(row.rost_pct)
-                for row in PlayerOwnership.select().where(
-                    PlayerOwnership.snapshot_date == yesterday
+            cache_key = (days, min_change, min_ownership, sort_by, direction, limit, yesterday)
+            cached = _trending_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < _TRENDING_TTL_SECONDS:
+                return OwnershipTrendingResp(
+                    status=ApiStatus.SUCCESS,
+                    message=f"Trending players over {days} days (sorted by {sort_by})",
+                    data=cached[1],
                 )
-            }
-            # Find the closest available snapshot at or before past_date to handle
-            # gaps where the pipeline didn't run on the exact target date
+
+            # Get current and past ownership data in one round trip. The past
+            # snapshot is the closest available at or before past_date, to handle
+            # gaps where the pipeline didn't run on the exact target date.
+            latest = PlayerOwnership.alias()
             actual_past_date = (
-                PlayerOwnership.select(PlayerOwnership.snapshot_date)
-                .where(PlayerOwnership.snapshot_date <= past_date)
-                .order_by(PlayerOwnership.snapshot_date.desc())
-                .limit(1)
-                .scalar()
+                latest
+                .select(fn.MAX(latest.snapshot_date))
+                .where(latest.snapshot_date <= past_date)
             )
+            current_data = {}
             past_data = {}
-            if actual_past_date:
-                past_data = {
-                    row.player_id: float(row.rost_pct)
-                    for row in PlayerOwnership.select().where(
-                        PlayerOwnership.snapshot_date == actual_past_date
-                    )
-                }
+            for player_id, rost_pct, snapshot_date in (
+                PlayerOwnership.select(
+                    PlayerOwnership.player,
+                    PlayerOwnership.rost_pct,
+                    PlayerOwnership.snapshot_date,
+                )
+                .where(
+                    (PlayerOwnership.snapshot_date == yesterday)
+                    | (PlayerOwnership.snapshot_date == actual_past_date)
+                )
+                .tuples()
+                .iterator()
+            ):
+                bucket = current_data if snapshot_date == yesterday else past_data
+                bucket[player_id] = float(rost_pct)
+
+            # Yesterday's snapshot hasn't landed (or the pipeline failed):
+            # nothing can be trending, so skip the remaining lookups
+            if not current_data:
+                log.warning("ownership_snapshot_missing", date=yesterday.isoformat())
+                return OwnershipTrendingResp(
+                    status=ApiStatus.SUCCESS,
+                    message="No ownership snapshot available yet",
+                    data=OwnershipTrendingData(
+                        days=days,
+                        min_ownership=min_ownership,
+                        sort_by=sort_by,
+                        trending_up=[],
+                        trending_down=[],
+                    ),
+                )
 
             # Calculate changes with velocity
-            changes = []
-            for player_id in current_data:
-                current = current_data[player_id]
-                past = past_data.get(player_id, 0)
-                change = current - past
-
-                # Apply minimum ownership filter to reduce noise from deep roster players
-                if current < min_ownership and past < min_ownership:
-                    continue
+            changes = _compute_changes(current_data, past_data, min_ownership, min_change)
 
-                # Calculate velocity (relative change as percentage)
-                # For rising: use past as baseline (how much did they grow from baseline)
-                # For falling: use current as baseline (how much did they shrink to)
-                if change > 0:
-                    # Rising: velocity = how much they grew relative to starting point
-                    velocity = (change / past * 100) if past > 0 else 100.0
-                else:
-                    # Falling: velocity = how much they shrank relative to peak
-                    velocity = (change / past * 100) if past > 0 else -100.0
-
-                if abs(change) >= min_change:
-                    changes.append({
-                        "player_id": player_id,
-                        "current": current,
-                        "past": past,
-                        "change": change,
-                        "velocity": velocity,
-                    })
-
-            # Get player info for trending players
+            # Drop the direction that won't be returned before any lookups or
+            # model construction happen for it
+            if direction == "up":
+                changes = [c for c in changes if c["change"] > 0]
+            elif direction == "down":
+                changes = [c for c in changes if c["change"] <= 0]
+
+            # Player names and teams are independent lookups; run them concurrently
             player_ids = [c["player_id"] for c in changes]
-            player_info = {
-                p.id: p for p in Player.select().where(Player.id.in_(player_ids))
-            }
-
-            # Get team info from latest season stats, falling back to most recent game
-            team_info = {}
-            if player_ids:
-                latest_date = (
-                    PlayerSeasonStats.select(PlayerSeasonStats.as_of_date)
-                    .order_by(PlayerSeasonStats.as_of_date.desc())
-                    .limit(1)
-                    .scalar()
-                )
-                if latest_date:
-                    for stats in (
-                        PlayerSeasonStats.select()
-                        .where(
-                            (PlayerSeasonStats.player_id.in_(player_ids))
-                            & (PlayerSeasonStats.as_of_date == latest_date)
-                        )
-                    ):
-                        if stats.team_id:
-                            team_info[stats.player_id] = stats.team_id
-
-                # Fill missing teams from most recent game stats
-                missing_ids = [pid for pid in player_ids if pid not in team_info]
-                if missing_ids:
-                    for pid in missing_ids:
-                        latest_game = (
-                            PlayerGameStats.select(PlayerGameStats.team)
-                            .where(
-                                (PlayerGameStats.player_id == pid)
-                                & (PlayerGameStats.team.is_null(False))
-                            )
-                            .order_by(PlayerGameStats.game_date.desc())
-                            .first()
-                        )
-                        if latest_game and latest_game.team_id:
-                            team_info[pid] = latest_game.team_id
+            player_names, team_info = await asyncio.gather(
+                asyncio.to_thread(_fetch_player_names, player_ids),
+                asyncio.to_thread(_fetch_player_teams, player_ids),
+            )
 
             # Build trending lists
             trending_up = []
             trending_down = []
 
             for c in changes:
-                player = player_info.get(c["player_id"])
-                if not player:
+                player_name = player_names.get(c["player_id"])
+                if not player_name:
                     continue
 
                 trending_player = TrendingPlayer(
                     player_id=c["player_id"],
-                    player_name=player.name,
+                    player_name=player_name,
                     team=team_info.get(c["player_id"]),
                     current_ownership=round(c["current"], 1),
                     previous_ownership=round(c["past"], 1),
@@ -179,28 +264,30 @@ class OwnershipService:
 
             # Sort by velocity (default) or absolute change
             sort_key = "velocity" if sort_by == "velocity" else "change"
-            trending_up.sort(key=lambda x: getattr(x, sort_key), reverse=True)
-            trending_down.sort(key=lambda x: getattr(x, sort_key))
+            # Only the top `limit` per direction are returned, so select them
+            # with a bounded heap instead of sorting everything
+            key = attrgetter(sort_key)
+            trending_up = heapq.nlargest(limit, trending_up, key=key)
+            trending_down = heapq.nsmallest(limit, trending_down, key=key)
+
+            data = OwnershipTrendingData(
+                days=days,
+                min_ownership=min_ownership,
+                sort_by=sort_by,
+                trending_up=trending_up,
+                trending_down=trending_down,
+            )
 
-            trending_up = trending_up[:limit]
-            trending_down = trending_down[:limit]
-
-            # Filter by direction
-            if direction == "up":
-                trending_down = []
-            elif direction == "down":
-                trending_up = []
+            # Don't cache empty results; yesterday's snapshot may not have landed yet
+            if trending_up or trending_down:
+                if len(_trending_cache) >= _TRENDING_MAX_ENTRIES:
+                    _trending_cache.clear()
+                _trending_cache[cache_key] = (time.monotonic(), data)
 
             return OwnershipTrendingResp(
                 status=ApiStatus.SUCCESS,
                 message=f"Trending players over {days} days (sorted by {sort_by})",
-                data=OwnershipTrendingData(
-                    days=days,
-                    min_ownership=min_ownership,
-                    sort_by=sort_by,
-                    trending_up=trending_up,
-                    trending_down=trending_down,
-                ),
+                data=data,
             )
 
         except Exception as e:
@@ -40,7 +40,7 @@ class PlayerGamesService:
                 )
 
             # Get game stats
-            games = PlayerGameStats.get_player_games(player_id=player_id, limit=limit)
+            games = PlayerGameStats.get_player_game_logs(player_id=player_id, limit=limit)
 
             game_logs = [
                 GameLog(
@@ -66,7 +66,7 @@ class PlayerGamesService:
             ]
 
             # Get current team from most recent game
-            current_team = games[0].team_id if games else None
+            current_team = games[0].team if games else None
 
             return PlayerGamesResp(
                 status=ApiStatus.SUCCESS,
@@ -1,5 +1,4 @@
 import math
-import unicodedata
 from typing import Optional
 from datetime import date, timedelta
 from peewee import fn, Case
@@ -21,6 +20,7 @@ from db.models.nba.player_rolling_stats import PlayerRollingStats
 from db.models.nba.player_advanced_stats import PlayerAdvancedStats
 from db.models.nba.player_injuries import PlayerInjury
 from core.logging import get_logger
+from pipelines.transformers.names import normalize_name as _normalize_name
 
 
 def _parse_window_size(window: str) -> int | None:
@@ -32,16 +32,67 @@ def _parse_window_size(window: str) -> int | None:
     return None
 
 
-def _normalize_name(name: str) -> str:
-    """Normalize a name by removing diacritics and converting to lowercase."""
-    normalized = unicodedata.normalize("NFD", name)
-    ascii_name = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-    return ascii_name.lower().strip()
+# Box score columns summed into average stats
+_TOTAL_COLUMNS = (
+    "fpts", "pts", "reb", "ast", "stl", "blk", "tov", "min",
+    "fgm", "fga", "fg3m", "fg3a", "ftm", "fta",
+)
+
+
+def _fetch_game_stat_totals(*conditions) -> dict:
+    """
+    Sum box score columns over the PlayerGameStats rows matching conditions.
+
+    One aggregate query; no game rows are fetched.
+
+    Returns:
+        Dict with "games" (row count) and one total per _TOTAL_COLUMNS name
+    """
+    query = PlayerGameStats.select(
+        fn.COUNT(PlayerGameStats.id).alias("games"),
+        *[
+            fn.COALESCE(fn.SUM(getattr(PlayerGameStats, col)), 0).alias(col)
+            for col in _TOTAL_COLUMNS
+        ],
+    )
+    if conditions:
+        query = query.where(*conditions)
+    return query.dicts().get()
 
 
 def _compute_avg_stats(game_logs_list: list) -> AvgStats:
     """Compute average stats from a list of game log records."""
-    games = len(game_logs_list)
+    # One pass over the games, accumulating every column together
+    fpts = pts = reb = ast = stl = blk = tov = mins = 0
+    fgm = fga = fg3m = fg3a = ftm = fta = 0
+    for g in game_logs_list:
+        fpts += g.fpts
+        pts += g.pts
+        reb += g.reb
+        ast += g.ast
+        stl += g.stl
+        blk += g.blk
+        tov += g.tov
+        mins += g.min
+        fgm += g.fgm
+        fga += g.fga
+        fg3m += g.fg3m
+        fg3a += g.fg3a
+        ftm += g.ftm
+        fta += g.fta
+
+    return _avg_stats_from_totals({
+        "games": len(game_logs_list),
+        "fpts": fpts, "pts": pts, "reb": reb, "ast": ast,
+        "stl": stl, "blk": blk, "tov": tov, "min": mins,
+        "fgm": fgm, "fga": fga, "fg3m": fg3m, "fg3a": fg3a,
+        "ftm": ftm, "fta": fta,
+    })
+
+
+def _avg_stats_from_totals(totals: dict) -> AvgStats:
+    """Compute average stats from summed box score totals and a game count."""
+    games = totals["games"]
     if games == 0:
         return AvgStats(
             avg_fpts=0, avg_points=0, avg_rebounds=0, avg_assists=0,
@@ -51,20 +102,20 @@ def _compute_avg_stats(game_logs_list: list) -> AvgStats:
             avg_fgm=0, avg_fga=0, avg_fg3m=0, avg_fg3a=0, avg_ftm=0, avg_fta=0,
         )
 
-    total_fpts = sum(g.fpts for g in game_logs_list)
-    total_pts = sum(g.pts for g in game_logs_list)
-    total_reb = sum(g.reb for g in game_logs_list)
-    total_ast = sum(g.ast for g in game_logs_list)
-    total_stl = sum(g.stl for g in game_logs_list)
-    total_blk = sum(g.blk for g in game_logs_list)
-    total_tov = sum(g.tov for g in game_logs_list)
-    total_min = sum(g.min for g in game_logs_list)
-    total_fgm = sum(g.fgm for g in game_logs_list)
-    total_fga = sum(g.fga for g in game_logs_list)
-    total_fg3m = sum(g.fg3m for g in game_logs_list)
-    total_fg3a = sum(g.fg3a for g in game_logs_list)
-    total_ftm = sum(g.ftm for g in game_logs_list)
-    total_fta = sum(g.fta for g in game_logs_list)
+    total_fpts = totals["fpts"]
+    total_pts = totals["pts"]
+    total_reb = totals["reb"]
+    total_ast = totals["ast"]
+    total_stl = totals["stl"]
+    total_blk = totals["blk"]
+    total_tov = totals["tov"]
+    total_min = totals["min"]
+    total_fgm = totals["fgm"]
+    total_fga = totals["fga"]
+    total_fg3m = totals["fg3m"]
+    total_fg3a = totals["fg3a"]
+    total_ftm = totals["ftm"]
+    total_fta = totals["fta"]
 
     # Basic shooting percentages
     avg_fg_pct = round((total_fgm / total_fga) * 100, 1) if total_fga > 0 else 0.0
@@ -180,18 +231,11 @@ class PlayerService:
                 )
 
             # Step 2: Get all game logs for the player from PlayerGameStats
-            game_logs_query = (
-                PlayerGameStats.select()
-                .where(PlayerGameStats.player_id == player.id)
-                .order_by(PlayerGameStats.game_date.asc())
+            # (projected namedtuples, oldest first)
+            game_logs_list = PlayerGameStats.get_player_game_logs(
+                player.id, team_id=team, newest_first=False
             )
 
-            # If team filter is provided, apply it
-            if team is not None:
-                game_logs_query = game_logs_query.where(PlayerGameStats.team_id == team)
-
-            game_logs_list = list(game_logs_query)
-
             if not game_logs_list:
                 return PlayerStatsResp(
                     status=ApiStatus.ERROR,
@@ -202,7 +246,7 @@ class PlayerService:
             # Get player info from Player dimension and most recent game
             latest_game = game_logs_list[-1]
             player_name = player.name
-            player_team = latest_game.team_id
+            player_team = latest_game.team
             games_played = len(game_logs_list)
 
             # Step 3: Apply window to compute averages
@@ -324,15 +368,20 @@ class PlayerService:
 
         # Fallback for non-standard windows
         cutoff_date = date.today() - timedelta(days=days)
-        games = list(
-            PlayerGameStats.select().where(
+        total = count = 0
+        for (fpts,) in (
+            PlayerGameStats.select(PlayerGameStats.fpts)
+            .where(
                 (PlayerGameStats.player_id == player_id)
                 & (PlayerGameStats.game_date >= cutoff_date)
             )
-        )
-        if not games:
+            .tuples()
+        ):
+            total += fpts
+            count += 1
+        if not count:
             return None
-        return round(sum(g.fpts for g in games) / len(games), 1)
+        return round(total / count, 1)
 
     @staticmethod
     def get_last_n_day_avg_batch(
@@ -377,29 +426,28 @@ class PlayerService:
                 result[rec.player.espn_id] = round(float(rec.fpts), 1)
             return result
 
-        # Fallback for non-standard windows
+        # Fallback for non-standard windows: running (total, count) per
+        # player, accumulated as the rows stream in
         cutoff_date = date.today() - timedelta(days=days)
         query = (
-            PlayerGameStats.select(PlayerGameStats, Player.espn_id)
+            PlayerGameStats.select(Player.espn_id, PlayerGameStats.fpts)
             .join(Player, on=(PlayerGameStats.player_id == Player.id))
             .where(
                 (Player.espn_id.in_(espn_ids)) &
                 (PlayerGameStats.game_date >= cutoff_date)
             )
+            .tuples()
         )
-        player_games: dict[int, list] = {eid: [] for eid in espn_ids}
-        for game in query:
-            espn_id = game.player.espn_id
-            if espn_id in player_games:
-                player_games[espn_id].append(game)
-        result = {}
-        for espn_id in espn_ids:
-            games = player_games[espn_id]
-            if games:
-                result[espn_id] = round(sum(g.fpts for g in games) / len(games), 1)
-            else:
-                result[espn_id] = None
-        return result
+        sums: dict[int, list] = {eid: [0, 0] for eid in espn_ids}
+        for espn_id, fpts in query:
+            acc = sums.get(espn_id)
+            if acc is not None:
+                acc[0] += fpts
+                acc[1] += 1
+        return {
+            espn_id: round(total / count, 1) if count else None
+            for espn_id, (total, count) in sums.items()
+        }
 
     @staticmethod
     def get_recent_weighted_avg_batch(
@@ -515,31 +563,32 @@ class PlayerService:
                     result[name_norm] = round(float(rec.fpts), 1)
             return result
 
-        # Fallback for non-standard windows
+        # Fallback for non-standard windows: running (total, count) per
+        # player, accumulated as the rows stream in
         cutoff_date = date.today() - timedelta(days=days)
         query = (
-            PlayerGameStats.select(PlayerGameStats, Player.name_normalized)
+            PlayerGameStats.select(
+                Player.name_normalized, PlayerGameStats.team, PlayerGameStats.fpts
+            )
             .join(Player, on=(PlayerGameStats.player_id == Player.id))
             .where(
                 (Player.name_normalized.in_(normalized_names)) &
                 (PlayerGameStats.game_date >= cutoff_date)
             )
+            .tuples()
         )
-        player_games: dict[str, list] = {name: [] for name in normalized_names}
-        for game in query:
-            game_name_norm = game.player.name_normalized
+        sums: dict[str, list] = {name: [0, 0] for name in normalized_names}
+        for game_name_norm, team_id, fpts in query:
             expected_team = name_team_map.get(game_name_norm)
-            if expected_team and game.team_id == expected_team:
-                if game_name_norm in player_games:
-                    player_games[game_name_norm].append(game)
-        result = {}
-        for name in normalized_names:
-            games = player_games[name]
-            if games:
-                result[name] = round(sum(g.fpts for g in games) / len(games), 1)
-            else:
-                result[name] = None
-        return result
+            if expected_team and team_id == expected_team:
+                acc = sums.get(game_name_norm)
+                if acc is not None:
+                    acc[0] += fpts
+                    acc[1] += 1
+        return {
+            name: round(total / count, 1) if count else None
+            for name, (total, count) in sums.items()
+        }
 
     @staticmethod
     async def get_player_percentiles(player_id: int, min_games: int = 20) -> PlayerPercentilesResp:
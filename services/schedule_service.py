@@ -1,5 +1,6 @@
 import json
 import os
+from bisect import bisect_right
 from datetime import datetime, date, timedelta
 import pytz
 from typing import Optional
@@ -10,6 +11,10 @@ from pathlib import Path
 _SCHEDULE_DATA: dict = {}
 _SCHEDULE_DATA_V2: dict = {}
 
+# Matchup periods sorted by start date, for bisecting a date to its period.
+# Built once from the schedule: (start_dates, [(start, end, matchup_num), ...])
+_MATCHUP_INDEX: tuple[list[date], list[tuple[date, date, str]]] | None = None
+
 def _load_schedule() -> dict:
     """Load the schedule JSON file."""
     global _SCHEDULE_DATA
@@ -34,6 +39,19 @@ def _parse_date(date_str: str) -> date:
     return datetime.strptime(date_str, "%m/%d/%Y").date()
 
 
+def _get_matchup_index() -> tuple[list[date], list[tuple[date, date, str]]]:
+    """Return matchup periods sorted by start date, parsing the schedule once."""
+    global _MATCHUP_INDEX
+    if _MATCHUP_INDEX is None:
+        schedule = _load_schedule().get("schedule", {})
+        periods = sorted(
+            (_parse_date(m["startDate"]), _parse_date(m["endDate"]), num)
+            for num, m in schedule.items()
+        )
+        _MATCHUP_INDEX = ([start for start, _, _ in periods], periods)
+    return _MATCHUP_INDEX
+
+
 def _get_nba_today() -> date:
     """Return the current fantasy scheduling date in ET.
 
@@ -65,24 +83,26 @@ def get_current_matchup(current_date: Optional[date] = None) -> Optional[dict]:
     if current_date is None:
         current_date = _get_nba_today()
 
-    schedule = _load_schedule().get("schedule", {})
+    # Periods don't overlap, so the only candidate is the last one starting
+    # on or before current_date
+    starts, periods = _get_matchup_index()
+    i = bisect_right(starts, current_date) - 1
+    if i < 0:
+        return None
 
-    for matchup_num, matchup_data in schedule.items():
-        start_date = _parse_date(matchup_data["startDate"])
-        end_date = _parse_date(matchup_data["endDate"])
-
-        if start_date <= current_date <= end_date:
-            day_index = (current_date - start_date).days
-            return {
-                "matchup_number": int(matchup_num),
-                "start_date": start_date,
-                "end_date": end_date,
-                "game_span": matchup_data["gameSpan"],
-                "games": matchup_data["games"],
-                "current_day_index": day_index
-            }
+    start_date, end_date, matchup_num = periods[i]
+    if current_date > end_date:
+        return None
 
-    return None
+    matchup_data = _load_schedule()["schedule"][matchup_num]
+    return {
+        "matchup_number": int(matchup_num),
+        "start_date": start_date,
+        "end_date": end_date,
+        "game_span": matchup_data["gameSpan"],
+        "games": matchup_data["games"],
+        "current_day_index": (current_date - start_date).days
+    }
 
 
 def get_matchup_by_number(matchup_number: int) -> Optional[dict]:
@@ -8,6 +8,7 @@ from schemas.streamer import (
     StreamerMode
 )
 from schemas.common import ApiStatus, LeagueInfo, FantasyProvider
+from core.logging import get_logger
 from services.espn_service import EspnService
 from services.yahoo_service import YahooService
 from services.player_service import PlayerService
@@ -299,9 +300,8 @@ class StreamerService:
             )
 
         except Exception as e:
-            print(f"Error in find_streamers: {e}")
-            import traceback
-            traceback.print_exc()
+            # Traceback is only rendered if the log line is emitted
+            get_logger().exception("find_streamers_error", error=str(e))
             return StreamerResp(
                 status=ApiStatus.ERROR,
                 message="Internal server error while finding streamers",
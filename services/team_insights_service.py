@@ -15,7 +15,12 @@ from schemas.common import ApiStatus, FantasyProvider
 from services.team_service import TeamService
 from services.espn_service import EspnService
 from services.yahoo_service import YahooService
-from services.player_service import PlayerService, _normalize_name, _compute_avg_stats
+from services.player_service import (
+    PlayerService,
+    _normalize_name,
+    _avg_stats_from_totals,
+    _fetch_game_stat_totals,
+)
 from services import schedule_service
 from db.models.nba.players import Player
 from db.models.nba.player_game_stats import PlayerGameStats
@@ -231,20 +236,18 @@ def _compute_category_strengths(
         if not player_ids:
             return None
 
-        # Query last 14 days of game stats for all roster players
+        # Sum the last 14 days of game stats for all roster players in SQL;
+        # only the totals are needed, not the game rows
         cutoff_date = date.today() - timedelta(days=14)
-        game_logs = list(
-            PlayerGameStats.select()
-            .where(
-                (PlayerGameStats.player_id.in_(player_ids))
-                & (PlayerGameStats.game_date >= cutoff_date)
-            )
+        totals = _fetch_game_stat_totals(
+            PlayerGameStats.player_id.in_(player_ids),
+            PlayerGameStats.game_date >= cutoff_date,
         )
 
-        if not game_logs:
+        if not totals["games"]:
             return None
 
-        avg_stats = _compute_avg_stats(game_logs)
+        avg_stats = _avg_stats_from_totals(totals)
 
         return CategoryStrengths(
             avg_points=avg_stats.avg_points,
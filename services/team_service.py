@@ -4,6 +4,7 @@ from services.espn_service import EspnService
 from services.yahoo_service import YahooService
 from schemas.common import ApiStatus, LeagueInfo, FantasyProvider
 import json
+import orjson
 
 class TeamService:
     
@@ -11,7 +12,7 @@ class TeamService:
     async def get_teams(user_id: int) -> TeamGetResp:
         try:
             teams_query = Team.select().where(Team.user_id == user_id)
-            teams: list[TeamResponse] = [TeamResponse(team_id=team.team_id, league_info=TeamService.deserialize_league_info(json.loads(team.league_info))) for team in teams_query]
+            teams: list[TeamResponse] = [TeamResponse(team_id=team.team_id, league_info=TeamService.deserialize_league_info(orjson.loads(team.league_info))) for team in teams_query]
 
             return TeamGetResp(status=ApiStatus.SUCCESS, message="Teams fetched successfully", data=teams)
             
@@ -152,7 +153,7 @@ class TeamService:
                 return TeamViewResp(status=ApiStatus.ERROR, message="Team not found", data=None)
 
             # This will be passed to the ESPN service to get the roster data
-            return TeamViewResp(status=ApiStatus.SUCCESS, message="Team fetched successfully", data=TeamResponse(team_id=team.team_id, league_info=TeamService.deserialize_league_info(json.loads(team.league_info))))
+            return TeamViewResp(status=ApiStatus.SUCCESS, message="Team fetched successfully", data=TeamResponse(team_id=team.team_id, league_info=TeamService.deserialize_league_info(orjson.loads(team.league_info))))
 
         except Exception as e:
             print(f"Error in view_team: {e}")
@@ -186,7 +187,7 @@ class TeamService:
                 return False
 
             # Deserialize, update tokens, re-serialize
-            league_info_dict = json.loads(team.league_info)
+            league_info_dict = orjson.loads(team.league_info)
             league_info_dict["yahoo_access_token"] = access_token
             league_info_dict["yahoo_refresh_token"] = refresh_token
             league_info_dict["yahoo_token_expiry"] = token_expiry
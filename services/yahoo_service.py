@@ -17,6 +17,7 @@ from urllib.parse import urlencode
 from schemas.common import ApiStatus, LeagueInfo
 from schemas.espn import ValidateLeagueResp, PlayerResp, TeamDataResp
 from schemas.matchup import MatchupResp, MatchupData, MatchupTeamResp, MatchupPlayerResp
+from core.logging import get_logger
 from core.settings import settings
 from utils.yahoo_helpers import (
     normalize_team_abbr,
@@ -975,9 +976,8 @@ class YahooService:
                 data=None
             )
         except Exception as e:
-            print(f"Error in Yahoo get_matchup_data: {e}")
-            import traceback
-            traceback.print_exc()
+            # Traceback is only rendered if the log line is emitted
+            get_logger().exception("yahoo_matchup_error", error=str(e))
             return MatchupResp(
                 status=ApiStatus.ERROR,
                 message=f"Internal server error: {str(e)}",
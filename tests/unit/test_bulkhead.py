@@ -0,0 +1,81 @@
+"""
+Unit tests for core.resilience.create_bulkhead.
+
+Verifies that:
+- A saturated bulkhead raises BulkheadFullError after max_wait
+- A slot is released when the wrapped call raises
+- ESPNExtractor.get_matchup_data still returns None when the bulkhead is full
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.resilience import BulkheadFullError, create_bulkhead
+from pipelines.extractors.espn import ESPNExtractor
+
+
+@pytest.mark.unit
+class TestCreateBulkhead:
+
+    def test_saturated_bulkhead_raises_after_max_wait(self):
+        bulkhead = create_bulkhead(name="test", max_concurrent=1, max_wait=0.1)
+        holding = threading.Event()
+        release = threading.Event()
+
+        @bulkhead
+        def hold_slot():
+            holding.set()
+            release.wait(timeout=5)
+
+        @bulkhead
+        def call():
+            return "ok"
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        try:
+            assert holding.wait(timeout=5)
+            start = time.monotonic()
+            with pytest.raises(BulkheadFullError):
+                call()
+            assert time.monotonic() - start >= 0.1
+        finally:
+            release.set()
+            holder.join(timeout=5)
+
+        # Once the holder finishes, the slot is free again
+        assert call() == "ok"
+
+    def test_slot_released_when_call_raises(self):
+        bulkhead = create_bulkhead(name="test", max_concurrent=1, max_wait=0.1)
+
+        @bulkhead
+        def fail():
+            raise ValueError("boom")
+
+        @bulkhead
+        def call():
+            return "ok"
+
+        with pytest.raises(ValueError):
+            fail()
+        assert call() == "ok"
+
+
+@pytest.mark.unit
+class TestESPNExtractorMatchupBulkhead:
+
+    def test_full_bulkhead_returns_none(self, monkeypatch):
+        def full(*args, **kwargs):
+            raise BulkheadFullError("espn_api bulkhead full (6 in flight)")
+
+        extractor = ESPNExtractor()
+        monkeypatch.setattr(extractor, "_get_matchup_view", full)
+
+        result = extractor.get_matchup_data(
+            league_id=1, team_name="Team", espn_s2="s2", swid="swid",
+            year=2026, matchup_period=1,
+        )
+        assert result is None
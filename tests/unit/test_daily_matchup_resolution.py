@@ -0,0 +1,75 @@
+"""
+Unit tests for services.matchup_service._resolve_players_with_day_stats.
+
+Runs the real query against an in-memory SQLite database so the LEFT
+JOIN's handling of players without a game that day is exercised end to end.
+"""
+
+from datetime import date
+
+import pytest
+from peewee import SqliteDatabase
+
+from db.models.nba.players import Player
+from db.models.nba.player_game_stats import PlayerGameStats
+from db.models.nba.teams import NBATeam
+from services.matchup_service import _resolve_players_with_day_stats
+
+
+MODELS = [NBATeam, Player, PlayerGameStats]
+GAME_DAY = date(2026, 1, 15)
+
+
+def _box_score(player_id: int, game_date: date, fpts: int) -> dict:
+    return {
+        "player": player_id, "team": "BOS", "game_date": game_date,
+        "fpts": fpts, "pts": 20, "reb": 5, "ast": 5, "stl": 1, "blk": 1,
+        "tov": 2, "min": 30, "fgm": 8, "fga": 15, "fg3m": 2, "fg3a": 5,
+        "ftm": 2, "fta": 2,
+    }
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch):
+    # SQLite has no "nba" schema (and rejects schema-qualified foreign keys)
+    for model in MODELS:
+        monkeypatch.setattr(model._meta, "schema", None)
+
+    test_db = SqliteDatabase(":memory:")
+    with test_db.bind_ctx(MODELS):
+        test_db.connect()
+        test_db.create_tables(MODELS)
+
+        NBATeam.create(id="BOS", name="Celtics", conference="East", division="Atlantic")
+        Player.create(id=1, espn_id=101, name="Played Today", name_normalized="played today")
+        Player.create(id=2, espn_id=102, name="Off Night", name_normalized="off night")
+        Player.create(id=3, espn_id=None, name="Name Only", name_normalized="name only")
+        PlayerGameStats.insert_many([
+            _box_score(1, GAME_DAY, 40),
+            # A game on another date must not count for GAME_DAY
+            _box_score(2, date(2026, 1, 14), 25),
+        ]).execute()
+
+        yield test_db
+        test_db.close()
+
+
+@pytest.mark.unit
+class TestResolvePlayersWithDayStats:
+    def test_player_without_game_still_resolves(self, sqlite_db):
+        espn_to_nba, name_to_nba, stats = _resolve_players_with_day_stats(
+            [101, 102], ["played today", "off night", "name only"], GAME_DAY
+        )
+
+        assert espn_to_nba == {101: 1, 102: 2}
+        assert name_to_nba == {"played today": 1, "off night": 2, "name only": 3}
+        assert set(stats) == {1}
+        assert stats[1].fpts == 40
+
+    def test_no_games_on_date(self, sqlite_db):
+        _, name_to_nba, stats = _resolve_players_with_day_stats(
+            [102], ["off night"], date(2026, 1, 16)
+        )
+
+        assert name_to_nba == {"off night": 2}
+        assert stats == {}
@@ -0,0 +1,25 @@
+"""
+Unit tests for pipelines.transformers.names.normalize_name.
+
+ASCII names take a fast path that skips NFD decomposition; these tests
+check both paths produce the same normalized form.
+"""
+
+import pytest
+
+from pipelines.transformers.names import normalize_name
+
+
+@pytest.mark.unit
+class TestNormalizeName:
+    def test_ascii_name(self):
+        assert normalize_name("  LeBron James ") == "lebron james"
+
+    def test_strips_diacritics(self):
+        assert normalize_name("Nikola Jokić") == "nikola jokic"
+        assert normalize_name("Jonas Valančiūnas ") == "jonas valanciunas"
+
+    def test_precomposed_and_decomposed_match(self):
+        # "é" as one code point vs "e" + combining acute accent
+        assert normalize_name("Th\u00e9o Maledon") == normalize_name("The\u0301o Maledon")
+        assert normalize_name("Théo Maledon") == "theo maledon"
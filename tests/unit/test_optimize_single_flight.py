@@ -0,0 +1,94 @@
+"""
+Unit tests for the generate-lineup single-flight in services.optimize_service.
+
+Verifies that:
+- Concurrent identical requests make one features-service call and share its result
+- Different payloads are not merged
+- A cancelled waiter doesn't cancel the shared request
+- The in-flight entry is removed after success or failure
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from services import optimize_service
+from services.optimize_service import _generate_lineup_shared, _inflight
+
+
+class _FakeFeaturesClient:
+    """Counts posts and holds each response until release is set."""
+
+    def __init__(self, status_code: int = 200):
+        self.calls = 0
+        self.status_code = status_code
+        self.release = asyncio.Event()
+
+    async def post(self, path, content, headers):
+        self.calls += 1
+        await self.release.wait()
+        request = httpx.Request("POST", f"http://features{path}")
+        return httpx.Response(self.status_code, content=b'{"echo":' + content + b"}", request=request)
+
+
+@pytest.fixture
+def features_client(monkeypatch):
+    client = _FakeFeaturesClient()
+    monkeypatch.setattr(optimize_service, "get_features_client", lambda: client)
+    yield client
+    _inflight.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGenerateLineupSingleFlight:
+
+    async def test_concurrent_duplicates_share_one_call(self, features_client):
+        first = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        second = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        await asyncio.sleep(0)
+        features_client.release.set()
+
+        assert await first == await second == b'{"echo":1}'
+        assert features_client.calls == 1
+        assert _inflight == {}
+
+    async def test_different_payloads_not_merged(self, features_client):
+        first = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        second = asyncio.ensure_future(_generate_lineup_shared(b"2"))
+        await asyncio.sleep(0)
+        features_client.release.set()
+
+        assert await first == b'{"echo":1}'
+        assert await second == b'{"echo":2}'
+        assert features_client.calls == 2
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self, features_client):
+        cancelled = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        survivor = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        features_client.release.set()
+        assert await survivor == b'{"echo":1}'
+        assert features_client.calls == 1
+
+    async def test_entry_removed_after_failure(self, features_client):
+        features_client.status_code = 503
+        waiter = asyncio.ensure_future(_generate_lineup_shared(b"1"))
+        await asyncio.sleep(0)
+        assert len(_inflight) == 1
+        features_client.release.set()
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await waiter
+        assert _inflight == {}
+
+        # The next identical request starts a fresh call
+        features_client.status_code = 200
+        assert await _generate_lineup_shared(b"1") == b'{"echo":1}'
+        assert features_client.calls == 2
@@ -0,0 +1,73 @@
+"""
+Unit tests for OptimizeService._transform_v2_response.
+
+The transform builds its nested models with model_construct (no validation),
+so these tests verify that:
+- The output still validates against the full OptimizeData schema
+- Moves, per-move gain and per-day projections are derived correctly
+"""
+
+import pytest
+
+from schemas.optimize import OptimizeData
+from services.optimize_service import OptimizeService
+
+
+def _player(name: str, avg: float, team: str = "LAL") -> dict:
+    return {"Name": name, "AvgPoints": avg, "Team": team}
+
+
+V2_RESULT = {
+    "Lineup": [
+        {
+            "Day": 0,
+            "Additions": [_player("Add A", 30.5)],
+            "Removals": [_player("Drop A", 12.0, "BOS")],
+            "Roster": {"PG": _player("Guard", 40.0), "C": _player("Center", 25)},
+        },
+        {
+            "Day": 2,
+            "Additions": [_player("Add B", 28.0), _player("Add C", 22.0)],
+            "Removals": [_player("Drop B", 10.0)],
+            "Roster": {"PG": _player("Guard", 40.0)},
+        },
+        {"Day": 3, "Additions": [], "Removals": [], "Roster": {}},
+    ],
+    "Improvement": 45,
+    "Week": 7,
+    "StreamingSlots": 2,
+    "Timestamp": "2026-03-04T12:00:00Z",
+}
+
+
+@pytest.mark.unit
+class TestTransformV2Response:
+    """Constructed output matches what full validation would produce."""
+
+    def test_output_validates_against_schema(self):
+        data = OptimizeService._transform_v2_response(V2_RESULT, week=7)
+        validated = OptimizeData.model_validate(data.model_dump())
+        assert validated.model_dump() == data.model_dump()
+
+    def test_moves_and_gain(self):
+        data = OptimizeService._transform_v2_response(V2_RESULT, week=7)
+        moves = data.recommended_moves
+        assert [m.player_add.name for m in moves] == ["Add A", "Add B", "Add C"]
+        assert moves[0].player_drop.name == "Drop A"
+        assert moves[2].player_drop is None  # more additions than removals
+        assert all(m.projected_gain == 15.0 for m in moves)  # 45 / 3 moves
+        assert moves[1].reason == "Day 2 streaming move"
+
+    def test_daily_projection(self):
+        data = OptimizeService._transform_v2_response(V2_RESULT, week=7)
+        day0 = data.daily_lineups[0]
+        assert day0.date == "Week 7, Day 0"
+        assert day0.active_players == ["Guard", "Center"]
+        assert day0.projected_fpts == 65.0
+        assert data.daily_lineups[2].projected_fpts == 0.0
+
+    def test_empty_lineup(self):
+        data = OptimizeService._transform_v2_response({}, week=1)
+        assert data.daily_lineups == []
+        assert data.recommended_moves == []
+        assert data.projected_total_fpts == 0.0
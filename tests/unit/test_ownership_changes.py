@@ -0,0 +1,60 @@
+"""
+Unit tests for the vectorized ownership change computation in ownership_service.
+
+Checks _compute_changes against the per-player rules it replaced:
+- Players below min_ownership in both snapshots are dropped
+- Changes smaller than min_change are dropped
+- Velocity is relative to past ownership, +/-100 when there was none
+"""
+
+import pytest
+
+from services.ownership_service import _compute_changes
+
+
+def _reference(current_data, past_data, min_ownership, min_change):
+    changes = []
+    for player_id, current in current_data.items():
+        past = past_data.get(player_id, 0)
+        change = current - past
+        if current < min_ownership and past < min_ownership:
+            continue
+        if change > 0:
+            velocity = (change / past * 100) if past > 0 else 100.0
+        else:
+            velocity = (change / past * 100) if past > 0 else -100.0
+        if abs(change) >= min_change:
+            changes.append({
+                "player_id": player_id,
+                "current": current,
+                "past": past,
+                "change": change,
+                "velocity": velocity,
+            })
+    return changes
+
+
+@pytest.mark.unit
+class TestComputeChanges:
+    CURRENT = {1: 15.0, 2: 65.0, 3: 2.0, 4: 40.0, 5: 8.5, 6: 1.0, 7: 30.0}
+    PAST = {1: 5.0, 2: 60.0, 3: 1.0, 4: 52.25, 6: 9.0, 7: 30.0}
+
+    def test_matches_per_player_rules(self):
+        assert _compute_changes(self.CURRENT, self.PAST, 3.0, 3.0) == _reference(
+            self.CURRENT, self.PAST, 3.0, 3.0
+        )
+
+    def test_velocity_without_baseline(self):
+        result = {c["player_id"]: c for c in _compute_changes({5: 8.5, 8: 0.0}, {}, 0.0, 0.0)}
+        assert result[5]["velocity"] == 100.0
+        assert result[8]["velocity"] == -100.0
+
+    def test_filters(self):
+        ids = [c["player_id"] for c in _compute_changes(self.CURRENT, self.PAST, 3.0, 3.0)]
+        # 3 is below min ownership in both snapshots, 7 did not move
+        assert 3 not in ids and 7 not in ids
+        # 6 fell out of the min ownership range but was above it before
+        assert 6 in ids
+
+    def test_empty_snapshot(self):
+        assert _compute_changes({}, self.PAST, 3.0, 3.0) == []
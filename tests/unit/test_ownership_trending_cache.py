@@ -0,0 +1,92 @@
+"""
+Unit tests for the OwnershipService.get_trending result cache.
+
+Runs the real snapshot query against an in-memory SQLite database and
+verifies that:
+- A repeat call within the 15-minute TTL is served from the cache
+- A call after the TTL expires recomputes from the database
+- Empty results are not cached
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from freezegun import freeze_time
+from peewee import SqliteDatabase
+
+from db.models.nba.players import Player
+from db.models.nba.player_ownership import PlayerOwnership
+from services import ownership_service
+from services.ownership_service import OwnershipService, _trending_cache
+
+
+MODELS = [Player, PlayerOwnership]
+# Noon US/Central on March 4, so "yesterday" is March 3
+NOW = "2026-03-04T18:00:00Z"
+YESTERDAY = date(2026, 3, 3)
+PAST = YESTERDAY - timedelta(days=7)
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch):
+    # SQLite has no "nba" schema (and rejects schema-qualified foreign keys)
+    for model in MODELS:
+        monkeypatch.setattr(model._meta, "schema", None)
+    # Team lookup uses Postgres DISTINCT ON and isn't under test here
+    monkeypatch.setattr(ownership_service, "_fetch_player_teams", lambda ids: {})
+
+    # One connection shared across threads: name lookups run in asyncio.to_thread
+    test_db = SqliteDatabase(":memory:", thread_safe=False, check_same_thread=False)
+    with test_db.bind_ctx(MODELS):
+        test_db.connect()
+        test_db.create_tables(MODELS)
+        Player.create(id=1, name="Breakout", name_normalized="breakout")
+        _trending_cache.clear()
+        yield test_db
+        _trending_cache.clear()
+        test_db.close()
+
+
+def _snapshot(rost_pct: float, snapshot_date: date) -> None:
+    PlayerOwnership.insert(
+        player=1, snapshot_date=snapshot_date, rost_pct=rost_pct
+    ).on_conflict_replace().execute()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTrendingCache:
+
+    async def test_hit_within_ttl_then_miss_after_expiry(self, sqlite_db):
+        _snapshot(10.0, PAST)
+        _snapshot(20.0, YESTERDAY)
+
+        with freeze_time(NOW) as frozen:
+            first = await OwnershipService.get_trending()
+            assert first.data.trending_up[0].current_ownership == 20.0
+
+            # A re-ingested snapshot isn't seen while the entry is fresh
+            _snapshot(30.0, YESTERDAY)
+            frozen.tick(timedelta(minutes=14))
+            cached = await OwnershipService.get_trending()
+            assert cached.data.trending_up[0].current_ownership == 20.0
+
+            frozen.tick(timedelta(minutes=2))
+            expired = await OwnershipService.get_trending()
+            assert expired.data.trending_up[0].current_ownership == 30.0
+
+    async def test_empty_result_not_cached(self, sqlite_db):
+        _snapshot(10.0, PAST)
+        _snapshot(10.5, YESTERDAY)
+
+        with freeze_time(NOW):
+            empty = await OwnershipService.get_trending()
+            assert empty.data.trending_up == []
+            assert empty.data.trending_down == []
+            assert _trending_cache == {}
+
+            # The next call recomputes and sees the new snapshot
+            _snapshot(20.0, YESTERDAY)
+            result = await OwnershipService.get_trending()
+            assert result.data.trending_up[0].current_ownership == 20.0
+            assert len(_trending_cache) == 1